@@ -4,6 +4,9 @@ Handles AI API integrations (OpenAI and Anthropic)
 """
 
 import os
+import hashlib
+import threading
+from collections import OrderedDict
 import requests
 from dotenv import load_dotenv
 
@@ -14,6 +17,12 @@ load_dotenv()
 class APIClient:
     """Manages AI API interactions"""
     
+    ANALYSIS_CACHE_SIZE = 64  # Max remembered (content, prompt) results
+    
+    # Static request parts, built once and shared by every request
+    SYSTEM_PROMPT = "You are a code analysis assistant. Analyze the provided code files based on the user's specific requirements."
+    OPENAI_SYSTEM_MESSAGE = {'role': 'system', 'content': SYSTEM_PROMPT}
+    
     def __init__(self):
         self.openai_api_key = os.getenv('OPENAI_API_KEY', '')
         self.anthropic_api_key = os.getenv('ANTHROPIC_API_KEY', '')
@@ -28,6 +37,7 @@ class APIClient:
             "GPT-4o": "gpt-4o",
             "GPT-4o Mini": "gpt-4o-mini"
         }
+        self.model_display_name = self.lookup_display_name(self.selected_model)
         
         # Model context limits (tokens)
         self.model_limits = {
@@ -44,6 +54,69 @@ class APIClient:
         self.session_tokens = 0
         self.last_prompt_tokens = 0
         self.last_completion_tokens = 0
+        
+        # SDK clients are created once and reused so their keep-alive
+        # connection pools skip the TCP/TLS handshake on later requests
+        self._anthropic_client = None
+        self._openai_client = None
+        self._client_lock = threading.Lock()
+        
+        # (api, model, digest of content + prompt) -> result, LRU ordered
+        self._analysis_cache = OrderedDict()
+        self._analysis_cache_lock = threading.Lock()
+    
+    def get_anthropic_client(self):
+        """Get the shared Anthropic client, creating it on first use"""
+        with self._client_lock:
+            if self._anthropic_client is None:
+                import anthropic
+                self._anthropic_client = anthropic.Anthropic(api_key=self.anthropic_api_key)
+            return self._anthropic_client
+    
+    def get_openai_client(self):
+        """Get the shared OpenAI client, creating it on first use"""
+        with self._client_lock:
+            if self._openai_client is None:
+                from openai import OpenAI
+                self._openai_client = OpenAI(api_key=self.openai_api_key)
+            return self._openai_client
+    
+    @property
+    def preferred_api(self):
+        """API used for analyses ('anthropic', 'openai' or None)"""
+        return self._preferred_api
+    
+    @preferred_api.setter
+    def preferred_api(self, api):
+        # Bind the matching analysis method once instead of branching per request
+        self._preferred_api = api
+        if api == 'anthropic':
+            self.perform_analysis = self.perform_anthropic_analysis
+        else:
+            self.perform_analysis = self.perform_openai_analysis
+    
+    def _analysis_cache_key(self, content, prompt):
+        """Key a request by API, model and a digest of its content and prompt"""
+        digest = hashlib.blake2b(content.encode() + b'\0' + prompt.encode(), digest_size=16).digest()
+        return (self.preferred_api, self.selected_model, digest)
+    
+    def get_cached_analysis(self, content, prompt):
+        """Return the remembered result for an identical request, or None"""
+        key = self._analysis_cache_key(content, prompt)
+        with self._analysis_cache_lock:
+            result = self._analysis_cache.get(key)
+            if result is not None:
+                self._analysis_cache.move_to_end(key)
+            return result
+    
+    def cache_analysis(self, content, prompt, result):
+        """Remember a successful result for its content and prompt"""
+        key = self._analysis_cache_key(content, prompt)
+        with self._analysis_cache_lock:
+            self._analysis_cache[key] = result
+            self._analysis_cache.move_to_end(key)
+            if len(self._analysis_cache) > self.ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
     
     def determine_preferred_api(self):
         """Determine which API to use based on available keys"""
@@ -60,13 +133,20 @@ class APIClient:
             self.selected_model = model_name
         elif model_name in self.available_models.keys():
             self.selected_model = self.available_models[model_name]
+        else:
+            return
+        self.model_display_name = self.lookup_display_name(self.selected_model)
     
-    def get_current_model_display_name(self):
-        """Get the display name of the current model"""
-        for display_name, model_id in self.available_models.items():
-            if model_id == self.selected_model:
+    def lookup_display_name(self, model_id):
+        """Find the display name for a model id"""
+        for display_name, available_id in self.available_models.items():
+            if available_id == model_id:
                 return display_name
-        return f"Custom: {self.selected_model}"
+        return f"Custom: {model_id}"
+    
+    def get_current_model_display_name(self):
+        """Get the display name of the current model (cached by set_model)"""
+        return self.model_display_name
     
     def get_context_limit(self):
         """Get context limit for current model"""
@@ -108,26 +188,45 @@ class APIClient:
         else:
             return "No API Key - Add to .env file"
     
-    def perform_anthropic_analysis(self, content, custom_prompt):
-        """Perform Claude analysis"""
+    def perform_anthropic_analysis(self, content, custom_prompt, on_text=None):
+        """Perform Claude analysis, passing text deltas to on_text as they arrive if given"""
         try:
-            import anthropic
+            client = self.get_anthropic_client()
             
-            client = anthropic.Anthropic(api_key=self.anthropic_api_key)
-            
-            message = client.messages.create(
+            # The files come first and end the cached prefix, so analysing the same
+            # selection with another prompt reuses the server-side prompt cache.
+            # Exact repeats never get here; get_cached_analysis answers those.
+            request = dict(
                 model="claude-3-haiku-20240307",
                 max_tokens=2000,
                 temperature=0.7,
-                system="You are a code analysis assistant. Analyze the provided code files based on the user's specific requirements.",
+                system=self.SYSTEM_PROMPT,
                 messages=[
                     {
                         "role": "user",
-                        "content": f"{custom_prompt}\n\nHere are the changed files to analyze:\n\n{content}"
+                        "content": [
+                            {
+                                "type": "text",
+                                "text": f"Here are the changed files to analyze:\n\n{content}",
+                                "cache_control": {"type": "ephemeral"}
+                            },
+                            {
+                                "type": "text",
+                                "text": custom_prompt
+                            }
+                        ]
                     }
                 ]
             )
             
+            if on_text:
+                with client.messages.stream(**request) as stream:
+                    for text in stream.text_stream:
+                        on_text(text)
+                    message = stream.get_final_message()
+            else:
+                message = client.messages.create(**request)
+            
             return message.content[0].text, None
             
         except Exception as e:
@@ -141,22 +240,29 @@ class APIClient:
             else:
                 return None, f"Error: {error_str}"
     
-    def perform_openai_analysis(self, content, custom_prompt):
-        """Perform OpenAI analysis"""
+    def perform_openai_analysis(self, content, custom_prompt, on_text=None):
+        """Perform OpenAI analysis, passing text deltas to on_text as they arrive if given"""
         try:
-            from openai import OpenAI
-            
-            client = OpenAI(api_key=self.openai_api_key)
+            client = self.get_openai_client()
             
             # GPT-5 uses different API endpoint (Responses API)
             if self.selected_model.startswith('gpt-5'):
-                response = client.responses.create(
+                request = dict(
                     model=self.selected_model,
-                    input=f'{custom_prompt}\n\nHere are the changed files to analyze:\n\n{content}',
+                    input=f"{custom_prompt}\n\nHere are the changed files to analyze:\n\n{content}",
                     reasoning={'effort': 'medium'},
                     text={'verbosity': 'medium'}
                 )
                 
+                if on_text:
+                    with client.responses.stream(**request) as stream:
+                        for event in stream:
+                            if event.type == 'response.output_text.delta':
+                                on_text(event.delta)
+                        response = stream.get_final_response()
+                else:
+                    response = client.responses.create(**request)
+                
                 # Track token usage for GPT-5 (if available)
                 if hasattr(response, 'usage'):
                     self._update_token_usage(response.usage)
@@ -165,22 +271,24 @@ class APIClient:
             
             # GPT-4 and older models use Chat Completions API
             else:
-                response = client.chat.completions.create(
+                request = dict(
                     model=self.selected_model,
                     messages=[
-                        {
-                            'role': 'system',
-                            'content': 'You are a code analysis assistant. Analyze the provided code files based on the user\'s specific requirements.'
-                        },
+                        self.OPENAI_SYSTEM_MESSAGE,
                         {
                             'role': 'user',
-                            'content': f'{custom_prompt}\n\nHere are the changed files to analyze:\n\n{content}'
+                            'content': f"{custom_prompt}\n\nHere are the changed files to analyze:\n\n{content}"
                         }
                     ],
                     max_tokens=4000,
                     temperature=0.7
                 )
                 
+                if on_text:
+                    return self._stream_chat_completion(client, request, on_text), None
+                
+                response = client.chat.completions.create(**request)
+                
                 # Track token usage for GPT-4 models
                 if hasattr(response, 'usage'):
                     self._update_token_usage(response.usage)
@@ -202,6 +310,28 @@ class APIClient:
             else:
                 return None, f"Error: {error_str}"
     
+    def _stream_chat_completion(self, client, request, on_text):
+        """Stream a chat completion, returning the full text"""
+        parts = []
+        usage = None
+        
+        # include_usage adds a final chunk carrying token counts and no choices
+        stream = client.chat.completions.create(**request, stream=True,
+                                                stream_options={'include_usage': True})
+        for chunk in stream:
+            if chunk.usage:
+                usage = chunk.usage
+            if chunk.choices and chunk.choices[0].delta.content:
+                text = chunk.choices[0].delta.content
+                parts.append(text)
+                on_text(text)
+        
+        # Track token usage for GPT-4 models
+        if usage:
+            self._update_token_usage(usage)
+        
+        return "".join(parts)
+    
     def _update_token_usage(self, usage):
         """Update token usage statistics"""
         if hasattr(usage, 'prompt_tokens'):
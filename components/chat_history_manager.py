@@ -21,6 +21,7 @@ class ChatSession:
         self.entries = []
         self.is_saved = False
         self.auto_named = False
+        self._formatted_date = None  # (updated_at, display string)
     
     def add_entry(self, entry):
         """Add a chat entry to this session"""
@@ -62,12 +63,18 @@ class ChatSession:
         return first_entry.prompt_text[:50] + "..." if len(first_entry.prompt_text) > 50 else first_entry.prompt_text
     
     def get_formatted_date(self):
-        """Get formatted date for display"""
+        """Get formatted date for display, reformatted only when updated_at changes"""
+        cached = self._formatted_date
+        if cached is not None and cached[0] == self.updated_at:
+            return cached[1]
+        
         try:
             dt = datetime.fromisoformat(self.updated_at)
-            return dt.strftime("%m/%d %H:%M")
+            formatted = dt.strftime("%m/%d %H:%M")
         except:
-            return self.updated_at[:16]
+            formatted = self.updated_at[:16]
+        self._formatted_date = (self.updated_at, formatted)
+        return formatted
 
 
 class ChatEntry:
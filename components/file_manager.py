@@ -4,12 +4,23 @@ Handles file operations and filtering
 """
 
 import os
+import re
+import stat
+import codecs
 import fnmatch
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
 
 class ChangedFile:
-    """Represents a changed file with its metadata"""
+    """Represents a changed file with its metadata
+    
+    Identified by its repo-relative path, which is how the app keys files.
+    """
+    __slots__ = ('abs_path', 'rel_path', 'status', 'expanded', 'loading', 'error',
+                 'content_preview', 'encoding', 'selected_for_analysis', 'widgets')
+    
     def __init__(self, abs_path, rel_path, status):
         self.abs_path = abs_path
         self.rel_path = rel_path
@@ -18,15 +29,35 @@ class ChangedFile:
         self.loading = False
         self.error = None
         self.content_preview = None
+        self.encoding = None  # Encoding detected on the last successful read
         self.selected_for_analysis = False
         self.widgets = {}
+    
+    def __eq__(self, other):
+        if not isinstance(other, ChangedFile):
+            return NotImplemented
+        return self.rel_path == other.rel_path
+    
+    def __hash__(self):
+        return hash(self.rel_path)
 
 
 class FileManager:
     """Manages file operations and filtering"""
     
+    CONTENT_CACHE_SIZE = 512  # Max cached file previews
+    PREVIEW_CHARS = 50000  # Longer files are truncated
+    PREVIEW_BYTES = PREVIEW_CHARS * 4  # Enough bytes for PREVIEW_CHARS of UTF-8
+    ENCODINGS = ('utf-8', 'latin-1', 'cp1252')
+    GLOB_CHARS = re.compile(r'[*?\[]')  # Exclude entries containing these are fnmatch globs
+    
     def __init__(self):
         self.exclude_paths = []
+        
+        # (abs_path, mtime_ns, size) -> (content_preview, error, encoding), LRU ordered.
+        # Guarded by a lock since files are loaded from worker threads
+        self._content_cache = OrderedDict()
+        self._content_cache_lock = threading.Lock()
         self.excluded_extensions = {
             # Images
             '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg', '.webp', '.ico', '.tiff',
@@ -46,12 +77,72 @@ class FileManager:
             '*node_modules*', '*__pycache__*', '*dist*', '*build*',
             '*.min.*', '.gitignore', '.env*', 'package-lock.json', 'yarn.lock'
         ]
+        self._pattern_regex = self.compile_globs(self.excluded_patterns)
+        
+        # Compiled form of exclude_paths as (prefixes, names, glob regex), rebuilt
+        # lazily after it changes. The Tk thread edits exclude_paths while
+        # refresh workers read it, so both sides go through the lock
+        self._exclude_compiled = None
+        self._exclude_lock = threading.Lock()
+    
+    @staticmethod
+    def compile_globs(patterns):
+        """Join glob patterns into one regex with fnmatch semantics (None if empty)"""
+        if not patterns:
+            return None
+        return re.compile('|'.join(fnmatch.translate(os.path.normcase(p)) for p in patterns))
     
     def set_exclude_paths(self, paths):
         """Set paths/patterns to exclude from file processing"""
         if isinstance(paths, str):
             paths = [paths]
-        self.exclude_paths = paths
+        with self._exclude_lock:
+            self.exclude_paths = paths
+            self._exclude_compiled = None
+    
+    def add_exclude_path(self, path):
+        """Add a path/pattern to exclude from file processing"""
+        with self._exclude_lock:
+            self.exclude_paths.append(path)
+            self._exclude_compiled = None
+    
+    def clear_exclude_paths(self):
+        """Remove all user-defined exclude paths"""
+        with self._exclude_lock:
+            self.exclude_paths.clear()
+            self._exclude_compiled = None
+    
+    def _compile_exclude_paths(self):
+        """Return (prefixes, names, glob regex) for exclude_paths, rebuilding it if stale"""
+        with self._exclude_lock:
+            if self._exclude_compiled is None:
+                patterns = list(self.exclude_paths)
+                
+                # Plain paths (what Remove adds) go in a set; only real globs need the regex
+                globs = [p for p in patterns if self.GLOB_CHARS.search(p)]
+                names = frozenset(os.path.normcase(p) for p in patterns
+                                  if not self.GLOB_CHARS.search(p))
+                
+                # Support both exact matches and glob patterns, at any depth
+                regex = self.compile_globs(globs + [f"*/{pattern}" for pattern in globs])
+                prefixes = tuple(os.path.normcase(p) for p in patterns)
+                self._exclude_compiled = (prefixes, names, regex)
+            return self._exclude_compiled
+    
+    @staticmethod
+    def _matches_exclude_name(normalized, names):
+        """Whether any trailing part of a normcased path after a separator is in names
+        
+        normcase turns '/' into os.sep on Windows, so os.sep is the only
+        separator left to split on. The whole path is covered by the prefix check.
+        """
+        sep = os.sep
+        index = normalized.find(sep)
+        while index != -1:
+            if normalized[index + 1:] in names:
+                return True
+            index = normalized.find(sep, index + 1)
+        return False
     
     def is_path_excluded(self, filepath):
         """Check if a file path should be excluded"""
@@ -64,74 +155,111 @@ class FileManager:
             return True
         
         # Check filename patterns
-        for pattern in self.excluded_patterns:
-            if fnmatch.fnmatch(filename, pattern) or fnmatch.fnmatch(filepath, pattern):
-                return True
+        normalized = os.path.normcase(filepath)
+        pattern_match = self._pattern_regex.match
+        if pattern_match(os.path.normcase(filename)) or pattern_match(normalized):
+            return True
         
         # Check user-defined exclude paths
         if self.exclude_paths:
-            for pattern in self.exclude_paths:
-                # Support both exact matches and glob patterns
-                if fnmatch.fnmatch(filepath, pattern) or \
-                   fnmatch.fnmatch(filepath, f"*/{pattern}") or \
-                   filepath.startswith(pattern):
-                    return True
+            compiled = self._exclude_compiled or self._compile_exclude_paths()
+            prefixes, names, regex = compiled
+            if normalized.startswith(prefixes):
+                return True
+            if names and self._matches_exclude_name(normalized, names):
+                return True
+            if regex is not None and regex.match(normalized):
+                return True
         
         return False
     
     def load_file_content(self, file_obj):
-        """Load content of a file"""
+        """Load content of a file, reusing the cached result while the file is unchanged"""
         try:
-            if not os.path.exists(file_obj.abs_path):
+            try:
+                st = os.stat(file_obj.abs_path)
+            except OSError:
                 file_obj.content_preview = None
                 file_obj.error = "File not found (deleted/renamed)"
                 return False
                 
-            if os.path.isdir(file_obj.abs_path):
+            if stat.S_ISDIR(st.st_mode):
                 file_obj.content_preview = None
                 file_obj.error = "Directory (not previewable)"
                 return False
                 
-            if not os.path.isfile(file_obj.abs_path):
+            if not stat.S_ISREG(st.st_mode):
                 file_obj.content_preview = None
                 file_obj.error = "Not a regular file"
                 return False
-
-            # Try to read file content
-            content = None
-            encodings = ['utf-8', 'latin-1', 'cp1252']
-
-            for encoding in encodings:
-                try:
-                    with open(file_obj.abs_path, 'r', encoding=encoding) as f:
-                        content = f.read()
-                    break
-                except UnicodeDecodeError:
-                    continue
-                except PermissionError:
-                    file_obj.content_preview = None
-                    file_obj.error = "Permission denied"
-                    return False
-                except OSError as e:
-                    file_obj.content_preview = None
-                    file_obj.error = f"Cannot read: {str(e)}"
-                    return False
-
-            if content is None:
-                file_obj.content_preview = None
-                file_obj.error = "Binary or unsupported encoding"
-                return False
-            elif len(content) > 50000:  # Large file
-                content = content[:50000] + "\n\n... (Content truncated - file is large) ..."
-                file_obj.content_preview = content
-                file_obj.error = None
-            else:
-                file_obj.content_preview = content
-                file_obj.error = None
             
-            return True
+            # Unchanged files (same mtime and size) return their cached preview
+            cache_key = (file_obj.abs_path, st.st_mtime_ns, st.st_size)
+            with self._content_cache_lock:
+                cached = self._content_cache.get(cache_key)
+                if cached is not None:
+                    self._content_cache.move_to_end(cache_key)
+            
+            if cached is None:
+                cached = self._read_file_content(file_obj.abs_path, file_obj.encoding)
+                if cached[1] is None or cached[1] == "Binary or unsupported encoding":
+                    # Only cache outcomes that depend on file content, not transient read errors
+                    with self._content_cache_lock:
+                        self._content_cache[cache_key] = cached
+                        if len(self._content_cache) > self.CONTENT_CACHE_SIZE:
+                            self._content_cache.popitem(last=False)
+            
+            file_obj.content_preview, file_obj.error, encoding = cached
+            if encoding:
+                file_obj.encoding = encoding
+            return file_obj.error is None
 
         except Exception as e:
             file_obj.content_preview = None
             file_obj.error = f"Error: {str(e)}"
-            return False
\ No newline at end of file
+            return False
+    
+    def _read_file_content(self, abs_path, encoding=None):
+        """Read and decode a file, returning (content_preview, error, encoding)
+        
+        The file is read once in binary mode and decoded in a single pass.
+        UTF-8 is always tried first, since latin-1 accepts any bytes; a
+        previously detected encoding only goes ahead of the other fallbacks.
+        """
+        try:
+            with open(abs_path, 'rb') as f:
+                data = f.read(self.PREVIEW_BYTES + 1)
+        except PermissionError:
+            return None, "Permission denied", None
+        except OSError as e:
+            return None, f"Cannot read: {str(e)}", None
+        
+        truncated = len(data) > self.PREVIEW_BYTES
+        if truncated:
+            data = data[:self.PREVIEW_BYTES]
+        
+        candidates = ['utf-8-sig' if data.startswith(codecs.BOM_UTF8) else 'utf-8']
+        if encoding and not encoding.startswith('utf-8'):
+            candidates.append(encoding)
+        candidates += [candidate for candidate in self.ENCODINGS[1:] if candidate not in candidates]
+        
+        content = None
+        for candidate in candidates:
+            try:
+                # A truncated read may end mid-character; final=False drops the partial bytes
+                decoder = codecs.getincrementaldecoder(candidate)()
+                content = decoder.decode(data, final=not truncated)
+                encoding = candidate
+                break
+            except UnicodeDecodeError:
+                continue
+
+        if content is None:
+            return None, "Binary or unsupported encoding", None
+        
+        # Match text-mode reads, which translate newlines
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+        if truncated or len(content) > self.PREVIEW_CHARS:  # Large file
+            content = content[:self.PREVIEW_CHARS] + "\n\n... (Content truncated - file is large) ..."
+        
+        return content, None, encoding
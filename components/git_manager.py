@@ -45,12 +45,12 @@ class GitManager:
             # Find repository root
             repo_root = self.find_repo_root(project_path)
             
-            # Get changed files using git with expanded untracked files
+            # Get changed files using git with expanded untracked files.
+            # -z gives NUL-delimited, unquoted paths; keep stdout as bytes
             result = subprocess.run(
-                ['git', 'status', '--porcelain', '-u'],
+                ['git', 'status', '--porcelain', '-u', '-z'],
                 cwd=repo_root,
                 capture_output=True,
-                text=True,
                 check=True
             )
             
@@ -61,46 +61,28 @@ class GitManager:
         except Exception as e:
             return None, f"Failed to get changed files: {e}"
     
-    def parse_porcelain_line(self, line):
-        """Parse git status --porcelain line robustly - handles both XY and X formats"""
-        if not line or len(line) < 2:
-            return None, None
-
-        # Git porcelain format can be:
-        # 1. Standard: XY<space>filename (X=index, Y=worktree)
-        # 2. Simple: X<space>filename (single status char)
-        
-        # Try to find the space separator
-        space_pos = -1
-        for i in range(1, min(4, len(line))):  # Check positions 1, 2, 3
-            if line[i] in [' ', '\t']:
-                space_pos = i
-                break
+    def parse_porcelain_output(self, output):
+        """Parse `git status --porcelain -z` bytes into (status, filepath) pairs
         
-        if space_pos == -1:
-            return None, None
+        Each record is XY<space>path. Renames/copies are followed by an extra
+        record holding the original path, which is skipped.
+        """
+        entries = []
+        records = output.split(b'\0')
+        record_count = len(records)
+        i = 0
         
-        status_part = line[:space_pos]
-        filepath = line[space_pos + 1:]  # Skip the separator
-        
-        if not filepath:  # Empty filename
-            return None, None
-
-        # Normalize status to always be 2 chars (pad with space if needed)
-        if len(status_part) == 1:
-            # Single char status (like "M") - this means modified in worktree
-            status = " " + status_part  # Convert "M" to " M"
-        else:
-            status = status_part
+        while i < record_count:
+            record = records[i]
+            i += 1
+            if len(record) < 4:  # Needs XY, separator and at least one path byte
+                continue
+            
+            xy = record[:2]
+            if b'R' in xy or b'C' in xy:
+                i += 1  # Skip the original path record
+            
+            status = xy.decode('ascii', 'replace').strip()
+            entries.append((status, os.fsdecode(record[3:])))
         
-        status = status.strip() if len(status.strip()) > 0 else status
-
-        # Handle rename/copy cases (R/C status)
-        if status and (status[0] in 'RC'):
-            # Format: "old -> new"
-            if ' -> ' in filepath:
-                old_path, new_path = filepath.split(' -> ', 1)
-                # Use the new path (right side)
-                filepath = new_path
-
-        return status, filepath
\ No newline at end of file
+        return entries
@@ -6,9 +6,57 @@ Handles the AI analysis section
 import tkinter as tk
 from tkinter import ttk, scrolledtext
 from datetime import datetime
+import itertools
+import threading
 from ..ui_utils import CustomScrollbar
 
 
+class AnalysisStream:
+    """Buffers response text streamed by a worker thread and renders it on the Tk thread
+    
+    Deltas written between two Tk flushes are joined and inserted with a single
+    call, so a fast stream costs one widget update per batch rather than per token.
+    """
+    
+    def __init__(self, panel, tag, prompt_type, prompt_text, model_used):
+        self.panel = panel
+        self.tag = tag
+        self.header = (prompt_type, prompt_text, model_used)
+        self.pending = []
+        self.lock = threading.Lock()
+        self.flush_scheduled = False
+        self.started = False
+    
+    def write(self, text):
+        """Queue streamed text (any thread)"""
+        with self.lock:
+            self.pending.append(text)
+            if self.flush_scheduled:
+                return
+            self.flush_scheduled = True
+        self.panel.analysis_text.after(0, self.flush)
+    
+    def flush(self):
+        """Insert all queued text (Tk thread)"""
+        with self.lock:
+            text = "".join(self.pending)
+            self.pending.clear()
+            self.flush_scheduled = False
+        
+        if not text:
+            return
+        if not self.started:
+            self.started = True
+            self.panel.begin_stream(self.tag, *self.header)
+        self.panel.append_stream(self.tag, text)
+    
+    def close(self, analysis=None):
+        """Finish the streamed response; analysis attaches the Send to Agent link (Tk thread)"""
+        self.flush()
+        if self.started:
+            self.panel.end_stream(self.tag, analysis)
+
+
 class AnalysisPanel:
     """Component for AI analysis interface"""
     
@@ -25,6 +73,10 @@ class AnalysisPanel:
         self.orchestrator_expanded = False
         self.chat_history = []
         self.send_to_agent_callback = None  # Will be set by main app
+        self.agent_responses = {}  # Response tag -> {'text', 'continue'} for Send to Agent links
+        self.agent_response_counter = 0
+        self.prompt_cache = {}  # Prompt Text widget -> stripped contents, dropped on edit
+        self.stream_ids = itertools.count(1)
         
         self.setup_ui()
     
@@ -47,17 +99,14 @@ class AnalysisPanel:
         self.toggle_orchestrator_btn = ttk.Button(analysis_buttons, text="Orchestrator ▼",
                                                   style='TButton')
         self.toggle_orchestrator_btn.pack(side=tk.LEFT, padx=2)
-        self.ui_utils.bind_hover_cursor(self.toggle_orchestrator_btn)
         
         self.toggle_prompt_btn = ttk.Button(analysis_buttons, text="Prompt ▼",
                                            style='TButton')
         self.toggle_prompt_btn.pack(side=tk.LEFT, padx=2)
-        self.ui_utils.bind_hover_cursor(self.toggle_prompt_btn)
         
         self.clear_chat_btn = ttk.Button(analysis_buttons, text="Clear Chat",
                                          style='Accent.TButton')
         self.clear_chat_btn.pack(side=tk.LEFT, padx=2)
-        self.ui_utils.bind_hover_cursor(self.clear_chat_btn)
         
         # Create collapsible sections
         self.create_orchestrator_section()
@@ -88,6 +137,30 @@ class AnalysisPanel:
             pady=12)
         self.analysis_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
+        # Horizontal rule between messages - a single tagged newline instead of "=" runs
+        self.analysis_text.tag_configure('hr',
+                                         font=(self.theme.fonts['code'][0], 1),
+                                         spacing1=8,
+                                         spacing3=8,
+                                         background=self.theme.colors['border'])
+        
+        # Send to Agent actions are tagged text, not embedded widgets
+        self.analysis_text.tag_configure('agent_bar', justify='right', spacing3=5)
+        self.analysis_text.tag_configure('agent_continue',
+                                         foreground=self.theme.colors['text_secondary'],
+                                         font=self.theme.fonts['small'])
+        self.analysis_text.tag_configure('agent_send',
+                                         foreground='#10a37f',
+                                         font=self.theme.fonts['button'],
+                                         underline=1)
+        for tag, handler in (('agent_continue', self.on_agent_continue_click),
+                             ('agent_send', self.on_agent_send_click)):
+            self.analysis_text.tag_bind(tag, "<Button-1>", handler)
+            self.analysis_text.tag_bind(tag, "<Enter>",
+                                        lambda e: self.analysis_text.config(cursor="hand2"))
+            self.analysis_text.tag_bind(tag, "<Leave>",
+                                        lambda e: self.analysis_text.config(cursor=""))
+        
         # Add custom scrollbar
         analysis_scrollbar = CustomScrollbar(analysis_text_frame, orient=tk.VERTICAL, 
                                            command=self.analysis_text.yview)
@@ -95,11 +168,7 @@ class AnalysisPanel:
         self.analysis_text.configure(yscrollcommand=analysis_scrollbar.set)
         
         # Add mousewheel support
-        def on_analysis_mousewheel(event):
-            self.analysis_text.yview_scroll(int(-1*(event.delta/120)), "units")
-            analysis_scrollbar.show_scrollbar()
-        
-        self.analysis_text.bind("<MouseWheel>", on_analysis_mousewheel)
+        analysis_scrollbar.attach_target(self.analysis_text)
     
     def create_orchestrator_section(self):
         """Create the orchestrator prompt section"""
@@ -139,13 +208,11 @@ class AnalysisPanel:
                                               variable=self.orchestrator_automated_var,
                                               style='TCheckbutton')
         orchestrator_auto_cb.pack(side=tk.LEFT, padx=(0, 10))
-        self.ui_utils.bind_hover_cursor(orchestrator_auto_cb)
         
         self.orchestrator_send_btn = ttk.Button(orchestrator_btn_frame, 
                                                text="Send to AI",
                                                style='Accent.TButton')
         self.orchestrator_send_btn.pack(side=tk.LEFT)
-        self.ui_utils.bind_hover_cursor(self.orchestrator_send_btn)
         
         # Set default orchestrator prompt text
         default_orchestrator = """Generate a text prompt for orchestrator Claude agent with clear instructions for fixing this issue.
@@ -157,6 +224,7 @@ Instructions for the orchestrator:
 - Do not add any code directly, use agents specified for their tasks
 - Coordinate between different agents to ensure smooth workflow"""
         self.orchestrator_text.insert('1.0', default_orchestrator)
+        self.track_prompt_edits(self.orchestrator_text)
     
     def create_prompt_section(self):
         """Create the regular prompt section"""
@@ -194,13 +262,11 @@ Instructions for the orchestrator:
                                         variable=self.prompt_automated_var,
                                         style='TCheckbutton')
         prompt_auto_cb.pack(side=tk.LEFT, padx=(0, 10))
-        self.ui_utils.bind_hover_cursor(prompt_auto_cb)
         
         self.prompt_send_btn = ttk.Button(prompt_btn_frame, 
                                          text="Send to AI",
                                          style='Accent.TButton')
         self.prompt_send_btn.pack(side=tk.LEFT)
-        self.ui_utils.bind_hover_cursor(self.prompt_send_btn)
         
         # Set default prompt text
         default_prompt = """Make a deep analysis of these code changes. Focus on:
@@ -209,6 +275,25 @@ Instructions for the orchestrator:
 - Security considerations
 - Performance implications"""
         self.prompt_text.insert('1.0', default_prompt)
+        self.track_prompt_edits(self.prompt_text)
+    
+    def track_prompt_edits(self, text_widget):
+        """Drop the cached prompt whenever the Text widget is edited"""
+        def on_modified(event):
+            if text_widget.edit_modified():
+                self.prompt_cache.pop(text_widget, None)
+                text_widget.edit_modified(False)
+        
+        text_widget.edit_modified(False)
+        text_widget.bind("<<Modified>>", on_modified)
+    
+    def get_prompt_text(self, text_widget):
+        """Get a prompt's stripped text, reading the widget only after it changed"""
+        prompt = self.prompt_cache.get(text_widget)
+        if prompt is None:
+            prompt = text_widget.get('1.0', 'end-1c').strip()
+            self.prompt_cache[text_widget] = prompt
+        return prompt
     
     def toggle_orchestrator_section(self):
         """Toggle the visibility of the orchestrator prompt section"""
@@ -237,14 +322,21 @@ Instructions for the orchestrator:
     def clear_chat(self):
         """Clear the chat history and analysis text"""
         self.chat_history.clear()
+        self.agent_responses.clear()
         self.analysis_text.delete(1.0, tk.END)
     
-    def display_analysis(self, analysis, prompt_type="AI", prompt_text="", model_used=None):
-        """Display AI analysis result in continuous chat format"""
+    def insert_separator(self):
+        """Insert a horizontal rule (tagged newline) followed by a blank line"""
+        self.analysis_text.insert(tk.END, "\n", 'hr')
+        self.analysis_text.insert(tk.END, "\n")
+    
+    def insert_analysis_header(self, prompt_type, prompt_text, model_used):
+        """Insert the separator, header and prompt of a chat entry; returns its response prefix"""
         current_content = self.analysis_text.get(1.0, tk.END).strip()
         
         if current_content:
-            self.analysis_text.insert(tk.END, "\n\n" + "="*60 + "\n\n")
+            self.analysis_text.insert(tk.END, "\n\n")
+            self.insert_separator()
         
         # Add timestamp
         timestamp = datetime.now().strftime("%H:%M:%S")
@@ -267,88 +359,108 @@ Instructions for the orchestrator:
             display_prompt = prompt_text[:200] + "..." if len(prompt_text) > 200 else prompt_text
             self.analysis_text.insert(tk.END, f"{display_prompt}\n\n")
         
-        # Insert response
-        response_start = self.analysis_text.index(tk.END)
-        
         # For Claude Agent responses, don't add "RESPONSE:" prefix as it's already a response
-        if prompt_type == "Claude Agent":
-            self.analysis_text.insert(tk.END, f"{analysis}")
-        elif prompt_type == "Error":
-            self.analysis_text.insert(tk.END, f"{analysis}")
-        else:
+        if prompt_type in ["Claude Agent", "Error"]:
+            return ""
+        elif model_used:
             # Include model name if available
-            if model_used:
-                # Get display name for the model
-                model_display = model_used.upper() if model_used else "AI"
-                self.analysis_text.insert(tk.END, f"🤖 {model_display} RESPONSE:\n{analysis}")
-            else:
-                self.analysis_text.insert(tk.END, f"🤖 RESPONSE:\n{analysis}")
+            return f"🤖 {model_used.upper()} RESPONSE:\n"
+        else:
+            return "🤖 RESPONSE:\n"
+    
+    def display_analysis(self, analysis, prompt_type="AI", prompt_text="", model_used=None):
+        """Display AI analysis result in continuous chat format"""
+        response_prefix = self.insert_analysis_header(prompt_type, prompt_text, model_used)
         
-        response_end = self.analysis_text.index(tk.END)
+        # Insert response
+        self.analysis_text.insert(tk.END, f"{response_prefix}{analysis}")
         
         # Add "Send to Agent" button after the response (except for errors)
         if prompt_type != "Error":
-            self.add_send_to_agent_button(analysis, response_end)
+            self.add_send_to_agent_button(analysis, tk.END)
         
         # Auto-scroll to bottom
         self.analysis_text.see(tk.END)
     
-    def add_send_to_agent_button(self, response_text, position):
-        """Add a 'Send to Agent' button after the response"""
-        print(f"DEBUG: Adding Send to Agent button for response: {response_text[:50]}...")
+    def open_stream(self, prompt_type="AI", prompt_text="", model_used=None):
+        """Create a stream for a response that will arrive in pieces (safe from any thread)
+        
+        Nothing is shown until the first text is flushed, so a request that fails
+        before producing output leaves no empty entry behind.
+        """
+        tag = f"stream_{next(self.stream_ids)}"
+        return AnalysisStream(self, tag, prompt_type, prompt_text, model_used)
+    
+    def begin_stream(self, tag, prompt_type, prompt_text, model_used):
+        """Insert a chat entry header for a streamed response"""
+        response_prefix = self.insert_analysis_header(prompt_type, prompt_text, model_used)
+        # The tagged range marks where later text goes, even if other entries are appended
+        self.analysis_text.insert(tk.END, response_prefix or "\n", tag)
+        self.analysis_text.see(tk.END)
+    
+    def append_stream(self, tag, text):
+        """Append text to a streamed response"""
+        if not self.analysis_text.tag_ranges(tag):
+            return  # Chat was cleared while streaming
+        self.analysis_text.insert(f"{tag}.last", text, tag)
+        self.analysis_text.see(f"{tag}.last")
+    
+    def end_stream(self, tag, analysis=None):
+        """Finish a streamed response, attaching Send to Agent for the full text"""
+        if not self.analysis_text.tag_ranges(tag):
+            return
         
-        try:
-            # Add spacing before button
-            self.analysis_text.insert(tk.END, "\n\n")
-            
-            # Create a frame that spans the full width for right alignment
-            button_container = tk.Frame(self.analysis_text, bg=self.theme.colors['chat_ai'])
-            
-            # Add checkbox for session continuation
-            continue_var = tk.BooleanVar(value=False)  # Default to fresh session
-            continue_check = tk.Checkbutton(button_container,
-                                          text="Continue session",
-                                          variable=continue_var,
-                                          bg=self.theme.colors['chat_ai'],
-                                          fg=self.theme.colors['text_secondary'],
-                                          selectcolor=self.theme.colors['chat_ai'],
-                                          activebackground=self.theme.colors['chat_ai'],
-                                          font=('Segoe UI', 9),
-                                          cursor='hand2')
-            continue_check.pack(side=tk.RIGHT, padx=(0, 10), pady=(0, 5))
-            
-            # Create the button with custom styling
-            send_button = tk.Button(button_container,
-                                  text="Send to Agent →",
-                                  font=self.theme.fonts['button'],
-                                  fg='#10a37f',  # Green text
-                                  bg=self.theme.colors['chat_ai'],  # Match background
-                                  activeforeground='#1a7f64',  # Darker green on click
-                                  activebackground=self.theme.colors['chat_ai'],
-                                  relief='solid',  # Solid relief for grey border
-                                  borderwidth=1,
-                                  bd=1,
-                                  highlightthickness=0,
-                                  cursor='hand2',
-                                  padx=15,
-                                  pady=5,
-                                  command=lambda text=response_text, cont_var=continue_var: self.handle_send_to_agent(text, cont_var.get()))
-            
-            # Pack button to the right of the container
-            send_button.pack(side=tk.RIGHT, padx=(0, 20), pady=(0, 5))
-            
-            # Insert the container frame into the text widget
-            self.analysis_text.window_create(tk.END, window=button_container, stretch=True)
-            
-            # Add final spacing
-            self.analysis_text.insert(tk.END, "\n")
-            
-            print("DEBUG: Send to Agent button added successfully!")
-            
-        except Exception as e:
-            print(f"DEBUG: Error adding Send to Agent button: {e}")
-            # Fallback: just add text indicating where button should be
-            self.analysis_text.insert(tk.END, "\n[Send to Agent button should appear here]\n")
+        response_end = self.analysis_text.index(f"{tag}.last")
+        self.analysis_text.tag_delete(tag)
+        if analysis is not None:
+            self.add_send_to_agent_button(analysis, response_end)
+        self.analysis_text.see(tk.END)
+    
+    def add_send_to_agent_button(self, response_text, position):
+        """Add a 'Send to Agent' link after the response"""
+        self.agent_response_counter += 1
+        response_tag = f"agent_response_{self.agent_response_counter}"
+        self.agent_responses[response_tag] = {'text': response_text, 'continue': False}
+        
+        # Spacing and the action line go in one insert so position stays valid
+        self.analysis_text.insert(position,
+                                  "\n\n", (),
+                                  "☐ Continue session", ('agent_bar', 'agent_continue', response_tag),
+                                  "     ", 'agent_bar',
+                                  "Send to Agent →", ('agent_bar', 'agent_send', response_tag),
+                                  "\n", 'agent_bar')
+    
+    def get_agent_response_tag(self, event):
+        """Return the response tag under the mouse pointer, if any"""
+        index = self.analysis_text.index(f"@{event.x},{event.y}")
+        for tag in self.analysis_text.tag_names(index):
+            if tag in self.agent_responses:
+                return tag
+        return None
+    
+    def on_agent_continue_click(self, event):
+        """Toggle the 'Continue session' box of the clicked response"""
+        response_tag = self.get_agent_response_tag(event)
+        if not response_tag:
+            return "break"
+        
+        response = self.agent_responses[response_tag]
+        response['continue'] = not response['continue']
+        
+        # The checkbox glyph is the first character carrying the response tag
+        box_index = self.analysis_text.index(f"{response_tag}.first")
+        self.analysis_text.delete(box_index)
+        self.analysis_text.insert(box_index, "☑" if response['continue'] else "☐",
+                                  ('agent_bar', 'agent_continue', response_tag))
+        return "break"
+    
+    def on_agent_send_click(self, event):
+        """Send the clicked response to the agent"""
+        response_tag = self.get_agent_response_tag(event)
+        if response_tag:
+            response = self.agent_responses[response_tag]
+            self.handle_send_to_agent(response['text'], response['continue'])
+        return "break"
     
     def handle_send_to_agent(self, response_text, continue_session=False):
         """Handle the Send to Agent button click"""
@@ -398,6 +510,7 @@ Instructions for the orchestrator:
     
     def display_session_history(self, session):
         """Display all entries from a chat session"""
+        self.agent_responses.clear()
         self.analysis_text.delete(1.0, tk.END)
         
         if not session.entries:
@@ -408,15 +521,16 @@ Instructions for the orchestrator:
         session_header = f"📝 Session: {session.session_name}\n"
         session_header += f"🕒 Created: {session.get_formatted_date()}\n"
         session_header += f"💬 {len(session.entries)} conversations\n"
-        session_header += "="*60 + "\n\n"
         
         self.analysis_text.insert(tk.END, session_header)
+        self.insert_separator()
         
         # Display each entry
         for i, entry in enumerate(session.entries, 1):
             # Entry separator
             if i > 1:
-                self.analysis_text.insert(tk.END, "\n" + "="*60 + "\n\n")
+                self.analysis_text.insert(tk.END, "\n")
+                self.insert_separator()
             
             # Entry header
             timestamp = entry.get_formatted_time()
@@ -21,6 +21,8 @@ class FileListPanel:
         self.frame = None
         self.canvas = None
         self.scrollable_frame = None
+        self.frame_window = None
+        self.scrollbar = None
         self.changed_files = []
         
         self.setup_ui()
@@ -64,23 +66,28 @@ class FileListPanel:
                                      command=self.canvas.yview)
         self.scrollable_frame = ttk.Frame(self.canvas, style='TFrame')
         
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        self.ui_utils.track_scrollregion(self.canvas, self.scrollable_frame)
         
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
+        self.frame_window = self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
         self.canvas.configure(yscrollcommand=scrollbar_v.set)
+        self.scrollbar = scrollbar_v
         
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar_v.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Bind mouse wheel
-        def on_mousewheel(event):
-            self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-            scrollbar_v.show_scrollbar()
-        
-        self.canvas.bind("<MouseWheel>", on_mousewheel)
+        scrollbar_v.attach_target(self.canvas)
+    
+    def begin_bulk(self):
+        """Unmap the file list while many widgets are created"""
+        self.canvas.itemconfigure(self.frame_window, state='hidden')
+        self.canvas.configure(yscrollcommand='')
+    
+    def end_bulk(self):
+        """Map the file list again so it is laid out and drawn once"""
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
+        self.canvas.itemconfigure(self.frame_window, state='normal')
+        self.scrollbar.set(*self.canvas.yview())
     
     def create_file_widget(self, file_obj, index, callbacks):
         """Create a widget for a single file"""
@@ -110,7 +117,6 @@ class FileListPanel:
         path_menu = ttk.Menubutton(buttons_frame, textvariable=path_var, 
                                   width=12, style='TButton')
         path_menu.pack(side=tk.LEFT, padx=2)
-        self.ui_utils.bind_hover_cursor(path_menu)
         
         path_dropdown = tk.Menu(path_menu, tearoff=0,
                                bg=self.theme.colors['bg_secondary'],
@@ -129,28 +135,24 @@ class FileListPanel:
                                      command=lambda: callbacks['copy_append'](file_obj),
                                      style='TButton')
         copy_append_btn.pack(side=tk.LEFT, padx=2)
-        self.ui_utils.bind_hover_cursor(copy_append_btn)
         
         # Show Content button
         show_btn = ttk.Button(buttons_frame, text="Show Content",
                              command=lambda: callbacks['toggle_content'](file_obj, index),
                              style='TButton')
         show_btn.pack(side=tk.LEFT, padx=2)
-        self.ui_utils.bind_hover_cursor(show_btn)
         
         # Select checkbox
-        select_var = tk.BooleanVar()
+        select_var = tk.BooleanVar(value=file_obj.selected_for_analysis)
         select_cb = ttk.Checkbutton(buttons_frame, text="Select", variable=select_var,
                                     command=lambda: callbacks['toggle_selection'](file_obj, select_var))
         select_cb.pack(side=tk.LEFT, padx=2)
-        self.ui_utils.bind_hover_cursor(select_cb)
         
         # Remove button
         remove_btn = ttk.Button(buttons_frame, text="Remove",
                                command=lambda: callbacks['remove_file'](file_obj),
                                style='TButton')
         remove_btn.pack(side=tk.LEFT, padx=2)
-        self.ui_utils.bind_hover_cursor(remove_btn)
         
         # Store widget references
         file_obj.widgets = {
@@ -162,6 +164,10 @@ class FileListPanel:
         
         return file_frame
     
+    def show_loading(self, file_obj):
+        """Show the loading state on a file's Show Content button"""
+        file_obj.widgets['show_btn'].config(text="Loading...", state='disabled')
+    
     def show_file_content(self, file_obj):
         """Display file content in the UI"""
         if file_obj.error:
@@ -186,7 +192,6 @@ class FileListPanel:
             copy_content_btn = ttk.Button(controls_frame, text="Copy Content",
                                          style='TButton')
             copy_content_btn.pack(side=tk.LEFT)
-            self.ui_utils.bind_hover_cursor(copy_content_btn)
             
             # Content text area
             content_text = scrolledtext.ScrolledText(content_frame, 
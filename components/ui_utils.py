@@ -5,15 +5,33 @@ Helper functions for UI operations
 
 import tkinter as tk
 from tkinter import ttk
-import pyperclip
+import time
+import weakref
+from operator import attrgetter
+
+
+DEFAULT_BACKGROUND = '#212121'
+
+# Parent widget -> detected background color, shared by all scrollbars
+_parent_background_cache = weakref.WeakKeyDictionary()
 
 
 class CustomScrollbar(tk.Canvas):
     """Custom scrollbar with completely invisible background - only handle visible"""
     
+    POSITION_EPSILON = 1e-4  # Smallest top/bottom change worth a redraw
+    HIDE_DELAY = 1.5         # Seconds of inactivity before the handle hides
+    HIDE_POLL_MS = 200       # Auto-hide poll interval
+    WHEEL_DELTA = 120        # Event delta of one mousewheel notch
+    WHEEL_BINDTAG = 'ScrollTarget'
+    
+    # Scrolled widget path -> the scrollbar that controls it, shared by the
+    # single class-level <MouseWheel> binding
+    wheel_targets = {}
+    
     def __init__(self, parent, orient=tk.VERTICAL, command=None, **kwargs):
         # Get parent background to make scrollbar invisible
-        parent_bg = self._get_parent_background_static(parent)
+        parent_bg = self._get_parent_background(parent)
         
         # Initialize as Canvas with transparent background
         super().__init__(parent, 
@@ -31,76 +49,87 @@ class CustomScrollbar(tk.Canvas):
         self.top = 0.0
         self.bottom = 1.0
         self.dragging = False
-        self.last_y = 0
+        self.last_pos = 0
+        
+        # Event coordinate/size along the scroll axis, chosen once instead of per event
+        vertical = orient == tk.VERTICAL
+        self._get_coord = attrgetter('y' if vertical else 'x')
+        self._get_length = attrgetter('height' if vertical else 'width')
         self.handle_color = '#10a37f'  # Default handle color
+        self._cached_length = 0  # Length along the scroll axis, refreshed on <Configure>
+        
+        # Pending work coalesced into one idle callback
+        self._pending_delta = 0.0
+        self._flush_scheduled = False
+        self._redraw_pending = False
         
-        # Auto-hide timer
+        # Auto-hide deadline, checked by a single poller while the handle is shown
+        self.hide_deadline = 0.0
         self.hide_timer = None
         self.visible = False
         
+        # Single handle item, moved with coords() instead of being recreated
+        self._handle_id = self.create_rectangle(0, 0, 0, 0, fill=self.handle_color,
+                                                outline='', state='hidden', tags="scrollbar")
+        
         # Bind events directly to canvas (self)
         self.bind("<Button-1>", self.on_click)
         self.bind("<B1-Motion>", self.on_drag)
         self.bind("<ButtonRelease-1>", self.on_release)
         self.bind("<MouseWheel>", self.on_mousewheel)
+        self.bind("<Configure>", self.on_configure)
     
     @staticmethod
-    def _get_parent_background_static(parent):
-        """Static method for background color detection before init"""
-        background_methods = [
-            lambda: parent.cget('bg'),
-            lambda: parent.cget('background'),
-            lambda: parent.master.cget('bg') if hasattr(parent, 'master') else None,
-        ]
-        
-        for method in background_methods:
-            try:
-                bg_color = method()
-                if bg_color and bg_color != '':
-                    return bg_color
-            except:
-                continue
-        return '#212121'  # Dark theme default
-    
-    def _get_parent_background(self, parent):
-        """Smart background color detection for different widget types"""
-        # Try different methods to get background color
-        background_methods = [
-            # Standard tkinter widgets
-            lambda: parent.cget('bg'),
-            lambda: parent.cget('background'),
-            # TTK widgets might not have bg, try getting from style
-            lambda: parent.master.cget('bg') if hasattr(parent, 'master') else None,
-            # Try to get from canvas if it's a canvas
-            lambda: parent.cget('bg') if 'canvas' in str(type(parent)).lower() else None,
-            # Get from theme manager colors if available
-            lambda: '#212121' if hasattr(parent, 'theme') else None,
-        ]
-        
-        for method in background_methods:
-            try:
-                bg_color = method()
-                if bg_color and bg_color != '':
-                    return bg_color
-            except:
-                continue
-        
-        # Fallback to theme-appropriate colors
-        return '#212121'  # Dark theme default
+    def _get_parent_background(parent, refresh=False):
+        """Background color detection for tk and ttk parents, cached per parent"""
+        if not refresh:
+            cached = _parent_background_cache.get(parent)
+            if cached:
+                return cached
+        
+        bg_color = None
+        try:
+            bg_color = parent.cget('bg')
+        except tk.TclError:
+            # TTK widgets have no bg option - fall back to their master
+            master = getattr(parent, 'master', None)
+            if master is not None:
+                try:
+                    bg_color = master.cget('bg')
+                except tk.TclError:
+                    pass
+        
+        bg_color = bg_color or DEFAULT_BACKGROUND  # Dark theme default
+        _parent_background_cache[parent] = bg_color
+        return bg_color
+    
+    def on_configure(self, event):
+        """Cache the scroll-axis length so hot paths avoid winfo_* round-trips"""
+        self._cached_length = self._get_length(event)
+        self.update_scrollbar()
     
     def update_colors(self, bg_color=None, handle_color='#10a37f'):
         """Update scrollbar colors dynamically"""
         if bg_color is None:
-            bg_color = self._get_parent_background(self.master)
+            bg_color = self._get_parent_background(self.master, refresh=True)
         
         self.configure(bg=bg_color)
-        self.handle_color = handle_color
-        self.update_scrollbar()  # Redraw with new colors
+        if handle_color != self.handle_color:
+            self.handle_color = handle_color
+            self.itemconfigure(self._handle_id, fill=handle_color)
+        self.update_scrollbar()
         
     def set(self, top, bottom):
         """Set scrollbar position (called by scrolled widget)"""
-        self.top = float(top)
-        self.bottom = float(bottom)
+        top = float(top)
+        bottom = float(bottom)
+        
+        # Scrolled widgets re-emit identical positions on cursor moves - nothing to redraw
+        if abs(top - self.top) < self.POSITION_EPSILON and abs(bottom - self.bottom) < self.POSITION_EPSILON:
+            return
+        
+        self.top = top
+        self.bottom = bottom
         self.update_scrollbar()
         
         # Show scrollbar when content is scrollable
@@ -110,37 +139,37 @@ class CustomScrollbar(tk.Canvas):
             self.hide_scrollbar()
     
     def update_scrollbar(self):
-        """Update scrollbar visual appearance"""
-        self.delete("scrollbar")
+        """Schedule a redraw of the handle on the next idle cycle"""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._redraw)
+    
+    def _redraw(self):
+        """Redraw the scrollbar handle"""
+        self._redraw_pending = False
+        canvas_length = self._cached_length
         
-        if not self.visible or (self.top <= 0 and self.bottom >= 1):
+        if not self.visible or (self.top <= 0 and self.bottom >= 1) or canvas_length <= 1:
+            self.itemconfigure(self._handle_id, state='hidden')
             return
-            
+        
         if self.orient == tk.VERTICAL:
-            canvas_height = self.winfo_height()
-            if canvas_height <= 1:
-                return
-                
             # Calculate handle position and size
-            handle_top = int(self.top * canvas_height)
-            handle_bottom = int(self.bottom * canvas_height)
+            handle_top = int(self.top * canvas_length)
+            handle_bottom = int(self.bottom * canvas_length)
             handle_height = max(handle_bottom - handle_top, 20)  # Minimum handle size
             
-            # Draw the handle with rounded appearance
-            self.create_rectangle(2, handle_top, 6, handle_top + handle_height,
-                                fill=self.handle_color, outline='', tags="scrollbar")
+            # Move the handle into place
+            self.coords(self._handle_id, 2, handle_top, 6, handle_top + handle_height)
         else:
             # Horizontal scrollbar logic
-            canvas_width = self.winfo_width()
-            if canvas_width <= 1:
-                return
-                
-            handle_left = int(self.top * canvas_width)
-            handle_right = int(self.bottom * canvas_width)
+            handle_left = int(self.top * canvas_length)
+            handle_right = int(self.bottom * canvas_length)
             handle_width = max(handle_right - handle_left, 20)
             
-            self.create_rectangle(handle_left, 2, handle_left + handle_width, 6,
-                                fill=self.handle_color, outline='', tags="scrollbar")
+            self.coords(self._handle_id, handle_left, 2, handle_left + handle_width, 6)
+        
+        self.itemconfigure(self._handle_id, state='normal')
     
     def show_scrollbar(self):
         """Show the scrollbar handle"""
@@ -148,35 +177,46 @@ class CustomScrollbar(tk.Canvas):
             self.visible = True
             self.update_scrollbar()
         
-        # Reset hide timer
-        if self.hide_timer:
-            self.after_cancel(self.hide_timer)
-        self.hide_timer = self.after(1500, self.hide_scrollbar)  # Hide after 1.5 seconds
+        # Push the hide deadline back; start the poller only if it isn't running
+        self.hide_deadline = time.monotonic() + self.HIDE_DELAY
+        if self.hide_timer is None:
+            self.hide_timer = self.after(self.HIDE_POLL_MS, self._poll_hide)
+    
+    def _poll_hide(self):
+        """Hide the handle once the deadline has passed, otherwise keep polling"""
+        if not self.dragging and time.monotonic() >= self.hide_deadline:
+            self.hide_timer = None
+            self.hide_scrollbar()
+        else:
+            self.hide_timer = self.after(self.HIDE_POLL_MS, self._poll_hide)
     
     def hide_scrollbar(self):
         """Hide the scrollbar handle"""
+        if not self.visible and not self.hide_timer:
+            return  # Already hidden
+        
         if not self.dragging:  # Don't hide while dragging
             self.visible = False
-            self.delete("scrollbar")
+            self.itemconfigure(self._handle_id, state='hidden')
             if self.hide_timer:
                 self.after_cancel(self.hide_timer)
                 self.hide_timer = None
     
     def on_click(self, event):
         """Handle mouse click on scrollbar"""
-        if self.orient == tk.VERTICAL:
-            canvas_height = self.canvas.winfo_height()
-            click_pos = event.y / canvas_height
-        else:
-            canvas_width = self.canvas.winfo_width()
-            click_pos = event.x / canvas_width
-            
+        canvas_length = self._cached_length
+        if canvas_length <= 1:
+            return
+        
+        click_pos = self._get_coord(event) / canvas_length
+        
         # Move to clicked position
         if self.command:
             self.command("moveto", click_pos)
         
         self.dragging = True
-        self.last_y = event.y if self.orient == tk.VERTICAL else event.x
+        self._pending_delta = 0.0
+        self.last_pos = self._get_coord(event)
         self.show_scrollbar()
     
     def on_drag(self, event):
@@ -184,25 +224,58 @@ class CustomScrollbar(tk.Canvas):
         if not self.dragging:
             return
             
-        if self.orient == tk.VERTICAL:
-            delta = event.y - self.last_y
-            canvas_height = self.canvas.winfo_height()
-            scroll_delta = delta / canvas_height if canvas_height > 0 else 0
-        else:
-            delta = event.x - self.last_y
-            canvas_width = self.canvas.winfo_width()
-            scroll_delta = delta / canvas_width if canvas_width > 0 else 0
+        pos = self._get_coord(event)
+        canvas_length = self._cached_length
+        scroll_delta = (pos - self.last_pos) / canvas_length if canvas_length > 0 else 0
         
-        if self.command and abs(scroll_delta) > 0.001:
-            self.command("scroll", int(scroll_delta * 100), "units")
+        # Accumulate motion and issue a single scroll command per idle cycle
+        self._pending_delta += scroll_delta
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after_idle(self._flush_scroll)
         
-        self.last_y = event.y if self.orient == tk.VERTICAL else event.x
+        self.last_pos = pos
         self.show_scrollbar()
     
+    def _flush_scroll(self):
+        """Send the accumulated drag distance to the scrolled widget"""
+        self._flush_scheduled = False
+        units = int(self._pending_delta * 100)
+        if not units:
+            return  # Keep sub-unit motion for the next flush
+        
+        self._pending_delta -= units / 100
+        if self.command:
+            self.command("scroll", units, "units")
+    
     def on_release(self, event):
         """Handle mouse release"""
         self.dragging = False
     
+    @classmethod
+    def install(cls, root):
+        """Register the mousewheel handler shared by all scrolled widgets"""
+        root.bind_class(cls.WHEEL_BINDTAG, "<MouseWheel>", cls.on_wheel_target)
+    
+    @classmethod
+    def on_wheel_target(cls, event):
+        scrollbar = cls.wheel_targets.get(str(event.widget))
+        if scrollbar is not None:
+            scrollbar.on_target_mousewheel(event)
+    
+    def attach_target(self, widget):
+        """Scroll widget with the mousewheel and reveal this scrollbar while doing so"""
+        self.wheel_targets[str(widget)] = self
+        tags = widget.bindtags()
+        if self.WHEEL_BINDTAG not in tags:
+            # Right after the widget's own tag, where a widget binding would run
+            widget.bindtags(tags[:1] + (self.WHEEL_BINDTAG,) + tags[1:])
+    
+    def on_target_mousewheel(self, event):
+        """Scroll the widget under the wheel (the one this scrollbar controls)"""
+        event.widget.yview_scroll(-int(event.delta / self.WHEEL_DELTA), "units")
+        self.show_scrollbar()
+    
     def on_mousewheel(self, event):
         """Handle mouse wheel scrolling"""
         if self.command:
@@ -212,58 +285,129 @@ class CustomScrollbar(tk.Canvas):
 
 
 class ToolTip:
-    """Simple tooltip widget for showing hover text"""
+    """Simple tooltip widget for showing hover text
+    
+    Tooltips are driven by one class binding on the ToolTip bindtag; each widget
+    only carries the tag and an entry in the text table.
+    """
+    
+    BINDTAG = 'ToolTip'
+    
+    # One withdrawn Toplevel + Label shared by every tooltip in the app
+    _window = None
+    _label = None
+    texts = {}  # Widget path -> tooltip text
+    
     def __init__(self, widget, text):
         self.widget = widget
-        self.text = text
-        self.tooltip = None
-        self.widget.bind("<Enter>", self.show_tooltip)
-        self.widget.bind("<Leave>", self.hide_tooltip)
-        
-    def show_tooltip(self, event=None):
-        if self.tooltip:
+        self.attach(widget, text)
+    
+    @property
+    def text(self):
+        return self.texts.get(str(self.widget))
+    
+    @text.setter
+    def text(self, text):
+        self.texts[str(self.widget)] = text
+    
+    @classmethod
+    def install(cls, root):
+        """Register the class bindings shared by all tooltips"""
+        root.bind_class(cls.BINDTAG, "<Enter>", cls.show_tooltip)
+        root.bind_class(cls.BINDTAG, "<Leave>", cls.hide_tooltip)
+    
+    @classmethod
+    def attach(cls, widget, text):
+        """Show text when hovering widget"""
+        cls.texts[str(widget)] = text
+        tags = widget.bindtags()
+        if cls.BINDTAG not in tags:
+            widget.bindtags(tags + (cls.BINDTAG,))
+    
+    @classmethod
+    def _get_window(cls, widget):
+        """Return the shared tooltip window, creating it on first use"""
+        if cls._window is None or not cls._window.winfo_exists():
+            window = tk.Toplevel(widget._root())
+            window.wm_overrideredirect(True)
+            window.withdraw()
+            
+            cls._label = tk.Label(window,
+                                  background="#ffffe0", 
+                                  foreground="#000000",
+                                  relief="solid", 
+                                  borderwidth=1,
+                                  font=("Arial", 9))
+            cls._label.pack()
+            cls._window = window
+        return cls._window
+    
+    @classmethod
+    def show_tooltip(cls, event):
+        widget = event.widget
+        text = cls.texts.get(str(widget))
+        if not text:
             return
             
-        x = self.widget.winfo_rootx() + self.widget.winfo_width() // 2
-        y = self.widget.winfo_rooty() - 30
-        
-        self.tooltip = tk.Toplevel()
-        self.tooltip.wm_overrideredirect(True)
-        self.tooltip.geometry(f"+{x}+{y}")
-        
-        label = tk.Label(self.tooltip, text=self.text, 
-                        background="#ffffe0", 
-                        foreground="#000000",
-                        relief="solid", 
-                        borderwidth=1,
-                        font=("Arial", 9))
-        label.pack()
-        
-    def hide_tooltip(self, event=None):
-        if self.tooltip:
-            self.tooltip.destroy()
-            self.tooltip = None
+        x = widget.winfo_rootx() + widget.winfo_width() // 2
+        y = widget.winfo_rooty() - 30
+        
+        window = cls._get_window(widget)
+        cls._label.configure(text=text)
+        window.wm_geometry(f"+{x}+{y}")
+        window.deiconify()
+        window.lift()
+    
+    @classmethod
+    def hide_tooltip(cls, event=None):
+        if cls._window is not None and cls._window.winfo_exists():
+            cls._window.withdraw()
 
 
 class UIUtils:
     """Utility functions for UI operations"""
     
+    HOVER_CURSOR_CLASSES = ('TButton', 'TMenubutton', 'TCheckbutton')
+    HOVER_BINDTAG = 'HoverCursor'  # For other widgets that should show the hand cursor
+    
+    @staticmethod
+    def install_class_bindings(root):
+        """Register hover cursor, tooltip and mousewheel handlers once per class instead of per widget"""
+        def on_enter(event):
+            event.widget.configure(cursor="hand2")
+        
+        def on_leave(event):
+            event.widget.configure(cursor="")
+        
+        # add='+' keeps ttk's own class bindings that drive the hover state
+        for widget_class in UIUtils.HOVER_CURSOR_CLASSES:
+            root.bind_class(widget_class, "<Enter>", on_enter, add='+')
+            root.bind_class(widget_class, "<Leave>", on_leave, add='+')
+        root.bind_class(UIUtils.HOVER_BINDTAG, "<Enter>", on_enter)
+        root.bind_class(UIUtils.HOVER_BINDTAG, "<Leave>", on_leave)
+        
+        ToolTip.install(root)
+        CustomScrollbar.install(root)
+    
     @staticmethod
     def bind_hover_cursor(widget):
-        """Bind hand cursor on hover for interactive widgets"""
-        widget.bind("<Enter>", lambda e: widget.configure(cursor="hand2"))
-        widget.bind("<Leave>", lambda e: widget.configure(cursor=""))
+        """Show the hand cursor on hover for interactive widgets"""
+        tags = widget.bindtags()
+        if UIUtils.HOVER_BINDTAG not in tags:
+            widget.bindtags(tags + (UIUtils.HOVER_BINDTAG,))
     
     @staticmethod
     def add_tooltip(widget, text):
-        """Add a tooltip to a widget"""
-        return ToolTip(widget, text)
+        """Add a tooltip to a widget, or update the text of its existing one"""
+        ToolTip.attach(widget, text)
     
     @staticmethod
     def copy_to_clipboard(text):
         """Copy text to clipboard"""
         try:
-            pyperclip.copy(text)
+            # Imported on first use - pyperclip probes platform backends at import time
+            from pyperclip import copy
+            copy(text)
             return True
         except Exception:
             return False
@@ -274,6 +418,29 @@ class UIUtils:
         status_var.set(message)
         # Note: The callback to reset would be handled by the main app
     
+    @staticmethod
+    def track_scrollregion(canvas, frame):
+        """Keep a canvas scrollregion sized to the frame embedded at its origin
+        
+        Uses the size carried by the frame's <Configure> event instead of
+        walking every canvas item with bbox("all"), and applies a burst of
+        resizes once per idle cycle.
+        """
+        state = {'size': (0, 0), 'scheduled': False}
+        
+        def apply_size():
+            state['scheduled'] = False
+            width, height = state['size']
+            canvas.configure(scrollregion=(0, 0, width, height))
+        
+        def on_configure(event):
+            state['size'] = (event.width, event.height)
+            if not state['scheduled']:
+                state['scheduled'] = True
+                canvas.after_idle(apply_size)
+        
+        frame.bind("<Configure>", on_configure)
+    
     @staticmethod
     def create_scrollable_frame(parent, bg_color):
         """Create a scrollable frame widget with custom scrollbar"""
@@ -288,10 +455,7 @@ class UIUtils:
         scrollbar = CustomScrollbar(canvas_frame, orient=tk.VERTICAL, command=canvas.yview)
         scrollable_frame = tk.Frame(canvas)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        UIUtils.track_scrollregion(canvas, scrollable_frame)
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -299,11 +463,7 @@ class UIUtils:
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Bind mousewheel to canvas
-        def on_mousewheel(event):
-            canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-            scrollbar.show_scrollbar()
-        
-        canvas.bind("<MouseWheel>", on_mousewheel)
+        # Scroll the canvas with the mousewheel
+        scrollbar.attach_target(canvas)
         
         return canvas, scrollable_frame
\ No newline at end of file
@@ -8,75 +8,95 @@ import subprocess
 import os
 from pathlib import Path
 
+def parse_porcelain_v2(output):
+    """Split NUL-delimited `git status --porcelain=v2 -z` bytes into (XY, path, orig_path) entries"""
+    entries = []
+    records = [os.fsdecode(record) for record in output.split(b'\0')]
+    i = 0
+
+    while i < len(records):
+        record = records[i]
+        i += 1
+        if not record:
+            continue
+
+        kind = record[0]
+        if kind == '1':
+            # 1 XY sub mH mI mW hH hI path
+            fields = record.split(' ', 8)
+            entries.append((fields[1], fields[8], None))
+        elif kind == '2':
+            # 2 XY sub mH mI mW hH hI Xscore path<NUL>origPath
+            fields = record.split(' ', 9)
+            entries.append((fields[1], fields[9], records[i] if i < len(records) else None))
+            i += 1
+        elif kind == 'u':
+            # u XY sub m1 m2 m3 mW h1 h2 h3 path
+            fields = record.split(' ', 10)
+            entries.append((fields[1], fields[10], None))
+        elif kind in '?!':
+            # ? path / ! path
+            entries.append((kind * 2, record[2:], None))
+        else:
+            print(f"  ✗ Unknown record type: '{record}'")
+
+    return entries
+
 def test_git_status(repo_path=None):
     """Test git status in the current directory or specified path"""
-    
+
     if repo_path:
         os.chdir(repo_path)
-    
+
     print("=== GIT STATUS DEBUG ===")
     print(f"Working directory: {os.getcwd()}")
-    
+
     try:
-        # Run git status --porcelain
+        # One porcelain v2 call carries both index and worktree state, so the
+        # short status and both diff views below are derived from it instead
+        # of spawning a separate git process for each
         result = subprocess.run(
-            ['git', 'status', '--porcelain'],
+            ['git', 'status', '--porcelain=v2', '-z'],
             capture_output=True,
-            text=True,
             check=True
         )
-        
+
         print(f"\nRaw git output (length: {len(result.stdout)}):")
-        print(f"'{result.stdout}'")
-        
-        # Split into lines
-        lines = result.stdout.strip().split('\n')
-        print(f"\nTotal lines: {len(lines)}")
-        
-        for i, line in enumerate(lines):
-            print(f"Line {i}: '{line}' (len: {len(line)})")
-            
-            if line.strip():
-                # Show character by character for debugging
-                print(f"  Chars: {[c for c in line[:10]]}")
-                
-                # Test the parsing logic
-                if len(line) >= 3:
-                    status_part = line[:2]
-                    separator = line[2]
-                    filepath = line[3:] if len(line) > 3 else ""
-                    
-                    print(f"  Status: '{status_part}' | Sep: '{separator}' | Path: '{filepath}'")
-                    
-                    if separator in [' ', '\t']:
-                        print(f"  ✓ Valid format")
-                    else:
-                        print(f"  ✗ Invalid separator: '{separator}' (ord: {ord(separator)})")
-        
-        # Also try git status with different options
-        print("\n=== ALTERNATIVE GIT COMMANDS ===")
-        
-        # Try git status short
-        try:
-            result2 = subprocess.run(['git', 'status', '-s'], capture_output=True, text=True, check=True)
-            print(f"git status -s output:\n'{result2.stdout}'")
-        except:
-            print("git status -s failed")
-        
-        # Try git diff --name-status
-        try:
-            result3 = subprocess.run(['git', 'diff', '--name-status'], capture_output=True, text=True, check=True)
-            print(f"git diff --name-status output:\n'{result3.stdout}'")
-        except:
-            print("git diff --name-status failed")
-            
-        # Try git diff --cached --name-status
-        try:
-            result4 = subprocess.run(['git', 'diff', '--cached', '--name-status'], capture_output=True, text=True, check=True)
-            print(f"git diff --cached --name-status output:\n'{result4.stdout}'")
-        except:
-            print("git diff --cached --name-status failed")
-            
+        print(repr(result.stdout))
+
+        entries = parse_porcelain_v2(result.stdout)
+        print(f"\nTotal entries: {len(entries)}")
+
+        for i, (xy, filepath, orig_path) in enumerate(entries):
+            rename_info = f" (from '{orig_path}')" if orig_path else ""
+            print(f"Entry {i}: Status: '{xy}' | Path: '{filepath}'{rename_info}")
+
+            if not filepath:
+                print(f"  ✗ Empty path")
+            elif not os.path.exists(filepath):
+                print(f"  ⚠ Path does not exist on disk (deleted/renamed)")
+            else:
+                print(f"  ✓ Valid entry")
+
+        print("\n=== DERIVED VIEWS ===")
+
+        # Equivalent of git status -s
+        print("git status -s:")
+        for xy, filepath, orig_path in entries:
+            print(f"  {xy.replace('.', ' ')} {filepath}")
+
+        # Equivalent of git diff --name-status (worktree changes)
+        print("git diff --name-status:")
+        for xy, filepath, orig_path in entries:
+            if xy[1] not in '.?!':
+                print(f"  {xy[1]}\t{filepath}")
+
+        # Equivalent of git diff --cached --name-status (staged changes)
+        print("git diff --cached --name-status:")
+        for xy, filepath, orig_path in entries:
+            if xy[0] not in '.?!':
+                print(f"  {xy[0]}\t{filepath}")
+
     except subprocess.CalledProcessError as e:
         print(f"Git command failed: {e}")
         print(f"Error output: {e.stderr}")
@@ -85,8 +105,8 @@ def test_git_status(repo_path=None):
 
 if __name__ == "__main__":
     import sys
-    
+
     if len(sys.argv) > 1:
         test_git_status(sys.argv[1])
     else:
-        test_git_status()
\ No newline at end of file
+        test_git_status()
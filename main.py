@@ -6,17 +6,33 @@ Uses React-style component decomposition for better maintainability
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
 import os
-import threading
-from pathlib import Path
+import sys
+import logging
+from logging.handlers import RotatingFileHandler
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 
 # Import our components
 from components import ThemeManager, GitManager, FileManager, ChangedFile, APIClient, UIUtils, CustomScrollbar, ChatHistoryManager, ClaudeRunner
 from components.ui import FileListPanel, AnalysisPanel
 
+# The .vbs launcher hides the console, so errors are also written here
+LOG_FILE = os.path.join(os.path.expanduser('~'), '.git_workflow_automator', 'app.log')
+logger = logging.getLogger(__name__)
+
 
 class WorkflowAutomator:
     """Main application class - orchestrates all components"""
     
+    # (minimum usage percentage, indicator), checked from the top
+    TOKEN_INDICATORS = (
+        (90, "🔴"),  # Red - almost full
+        (70, "🟡"),  # Yellow - getting full
+        (0, "🟢"),   # Green - plenty of space
+    )
+    SESSION_ROW_BINDTAG = 'SessionRow'  # Shared hover/click bindings of session rows
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Git Workflow Automator")
@@ -27,7 +43,8 @@ class WorkflowAutomator:
         # Start maximized - get screen dimensions and set window to full size
         screen_width = self.root.winfo_screenwidth()
         screen_height = self.root.winfo_screenheight()
-        self.root.geometry(f"{screen_width}x{screen_height}+0+0")
+        self.maximized_geometry = f"{screen_width}x{screen_height}+0+0"  # Reused by toggle_maximize
+        self.root.geometry(self.maximized_geometry)
         
         # Window state tracking
         self.is_maximized = True  # Start in maximized state
@@ -39,20 +56,39 @@ class WorkflowAutomator:
         self.file_manager = FileManager()
         self.api_client = APIClient()
         self.ui_utils = UIUtils()
+        self.ui_utils.install_class_bindings(self.root)
         self.chat_history_manager = ChatHistoryManager()
         self.claude_runner = ClaudeRunner()
         
+        # Shared worker threads for file reads triggered from the UI
+        self.io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='wa-io')
+        # Bounded pool for AI requests so rapid clicks can't spawn unbounded threads
+        self.ai_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='wa-ai')
+        # Fan-out pool for bulk reads (Append All); its threads are started once and kept
+        self.read_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix='wa-read')
+        
         # Application state
         self.project_path = ""
-        self.changed_files = []
-        self.selected_files = []
+        # rel_path -> ChangedFile, in display order
+        self.changed_files = {}
+        self.selected_files = {}
+        self.selected_positions = {}  # rel_path -> index of its block in the Selected pane
         self.files_section_collapsed = True
+        self.file_widgets_pending = False  # Widgets are built when the collapsed panel opens
         self.selected_expanded = False
         self.history_section_collapsed = True
+        self.refresh_generation = 0  # Incremented per refresh; stale worker results are dropped
         
         # Status tracking
         self.status_var = tk.StringVar()
         self.status_var.set("Ready")
+        self.status_reset_id = None  # Pending "Ready" reset for temporary messages
+        self.last_token_state = None  # (session tokens, context limit) last shown in token_var
+        self.token_display_pending = False  # An idle token counter refresh is scheduled
+        self.history_refresh_pending = False  # An idle session list refresh is scheduled
+        self.history_dirty = True  # Sessions changed while the history panel was hidden
+        self.error_queue = deque()  # (show_dialog, title, message) awaiting one combined dialog
+        self.error_report_id = None
         
         # UI Components (will be initialized in setup_ui)
         self.file_list_panel = None
@@ -62,8 +98,9 @@ class WorkflowAutomator:
         
         self.setup_ui()
         
-        # Try to auto-detect current project if in git repo
-        self.auto_detect_project()
+        # Try to auto-detect current project if in git repo, once the
+        # window has had its first paint
+        self.root.after_idle(self.auto_detect_project)
     
     def setup_ui(self):
         """Set up the main UI layout"""
@@ -73,6 +110,7 @@ class WorkflowAutomator:
         # Main frame with no padding to maximize space
         main_frame = ttk.Frame(self.root, style='TFrame')
         main_frame.grid(row=1, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.main_frame = main_frame
         
         # Configure grid weights
         self.root.columnconfigure(0, weight=1)
@@ -90,8 +128,8 @@ class WorkflowAutomator:
         # Create main content area
         self.setup_main_content(main_frame)
         
-        # Create chat history panel (initially hidden)
-        self.setup_chat_history_panel(main_frame)
+        # Chat history panel starts hidden - it is built on first toggle
+        self.history_frame = None
         
         # Create status bar at bottom
         self.setup_status_bar(main_frame)
@@ -130,21 +168,18 @@ class WorkflowAutomator:
         minimize_btn = ttk.Button(controls_frame, text="─", style='TitleButton.TButton',
                                  command=self.minimize_window, width=3)
         minimize_btn.pack(side=tk.LEFT)
-        self.ui_utils.bind_hover_cursor(minimize_btn)
         self.ui_utils.add_tooltip(minimize_btn, "Minimize")
         
         # Maximize/Restore button (start with restore icon since we're maximized)
         self.maximize_btn = ttk.Button(controls_frame, text="❐", style='TitleButton.TButton',
                                       command=self.toggle_maximize, width=3)
         self.maximize_btn.pack(side=tk.LEFT)
-        self.ui_utils.bind_hover_cursor(self.maximize_btn)
         self.ui_utils.add_tooltip(self.maximize_btn, "Restore")
         
         # Close button
         close_btn = ttk.Button(controls_frame, text="✕", style='TitleButtonClose.TButton',
                               command=self.close_window, width=3)
         close_btn.pack(side=tk.LEFT)
-        self.ui_utils.bind_hover_cursor(close_btn)
         self.ui_utils.add_tooltip(close_btn, "Close")
     
     # Window control methods
@@ -175,10 +210,7 @@ class WorkflowAutomator:
         else:
             # Maximize window
             self.normal_geometry = self.root.geometry()
-            # Get screen dimensions
-            screen_width = self.root.winfo_screenwidth()
-            screen_height = self.root.winfo_screenheight()
-            self.root.geometry(f"{screen_width}x{screen_height}+0+0")
+            self.root.geometry(self.maximized_geometry)
             self.maximize_btn.config(text="❐")
             self.ui_utils.add_tooltip(self.maximize_btn, "Restore")
             self.is_maximized = True
@@ -197,7 +229,7 @@ class WorkflowAutomator:
                 # Mark session as saved
                 self.chat_history_manager.current_session.is_saved = True
                 self.chat_history_manager.save_project_sessions()
-                self.status_var.set("Session saved")
+                self.set_status("Session saved")
             elif result == "discard":
                 # Don't save, just close
                 pass
@@ -210,11 +242,15 @@ class WorkflowAutomator:
             self.chat_history_manager.save_project_sessions()
         
         self.root.destroy()
+        
+        # Pool workers are not daemon threads and the interpreter would join them,
+        # so a running AI request or git call would keep a windowless process alive
+        logging.shutdown()
+        sys.stdout.flush()
+        os._exit(0)
     
     def show_save_session_dialog(self):
         """Show dialog asking if user wants to save current session"""
-        from tkinter import messagebox
-        
         session = self.chat_history_manager.current_session
         session_name = session.session_name if session else "Current Session"
         entry_count = len(session.entries) if session else 0
@@ -239,6 +275,8 @@ class WorkflowAutomator:
     
     def setup_header(self, main_frame):
         """Create the header with project path and API status"""
+        colors = self.theme_manager.colors
+        
         # Project path selection
         path_label = ttk.Label(main_frame, text="📂 Project Path:", 
                               style='Heading.TLabel')
@@ -250,7 +288,6 @@ class WorkflowAutomator:
         
         browse_btn = ttk.Button(main_frame, text="Browse", command=self.browse_project, style='TButton')
         browse_btn.grid(row=0, column=2, padx=(0, 10))
-        self.ui_utils.bind_hover_cursor(browse_btn)
         
         # API status and key management
         api_status = self.api_client.get_api_status()
@@ -258,12 +295,11 @@ class WorkflowAutomator:
                              style='Secondary.TLabel')
         api_label.grid(row=1, column=1, sticky=tk.W, padx=(10, 0), pady=(5, 5))
         
-        # Claude Code CLI status
-        claude_status = "Available" if self.claude_runner.is_claude_available() else "Not Found"
-        claude_status_emoji = "🤖" if claude_status == "Available" else "⚠️"
-        claude_label = ttk.Label(main_frame, text=f"{claude_status_emoji} Claude Code: {claude_status}",
-                                style='Secondary.TLabel')
-        claude_label.grid(row=2, column=1, sticky=tk.W, padx=(10, 0), pady=(0, 5))
+        # Claude Code CLI status - probed in the background so startup doesn't wait on a subprocess
+        self.claude_label = ttk.Label(main_frame, text="⏳ Claude Code: Checking...",
+                                     style='Secondary.TLabel')
+        self.claude_label.grid(row=2, column=1, sticky=tk.W, padx=(10, 0), pady=(0, 5))
+        self.io_pool.submit(self.probe_claude)
         
         self.api_key_var = tk.StringVar()
         if self.api_client.preferred_api == 'anthropic':
@@ -283,25 +319,36 @@ class WorkflowAutomator:
         model_menu = ttk.Menubutton(main_frame, textvariable=model_var, 
                                    width=20, style='TButton')
         model_menu.grid(row=2, column=2, padx=(0, 10))
-        self.ui_utils.bind_hover_cursor(model_menu)
         
-        # Create model dropdown menu
+        # Create model dropdown menu - entries are added the first time it opens
         model_dropdown = tk.Menu(model_menu, tearoff=0,
-                               bg=self.theme_manager.colors['bg_secondary'],
-                               fg=self.theme_manager.colors['text_primary'],
-                               activebackground=self.theme_manager.colors['accent'],
+                               bg=colors['bg_secondary'],
+                               fg=colors['text_primary'],
+                               activebackground=colors['accent'],
                                activeforeground='white',
-                               borderwidth=0)
-        
-        # Add model options
-        for display_name, model_id in self.api_client.available_models.items():
-            model_dropdown.add_command(
-                label=display_name,
-                command=lambda name=display_name: self.select_model(name)
-            )
+                               borderwidth=0,
+                               postcommand=self.build_model_menu)
         
         model_menu.config(menu=model_dropdown)
         self.model_menu = model_menu
+        self.model_dropdown = model_dropdown
+    
+    def build_model_menu(self):
+        """Add model options to the dropdown on first open
+        
+        Entries are radiobuttons on model_var, so they share one command
+        instead of holding a lambda each.
+        """
+        for display_name in self.api_client.available_models:
+            self.model_dropdown.add_radiobutton(label=display_name,
+                                                variable=self.model_var,
+                                                value=display_name,
+                                                command=self.on_model_picked)
+        self.model_dropdown.configure(postcommand='')
+    
+    def on_model_picked(self):
+        """Apply the model chosen in the dropdown"""
+        self.select_model(self.model_var.get())
     
     def setup_main_content(self, main_frame):
         """Create the main content area with panels"""
@@ -355,7 +402,6 @@ class WorkflowAutomator:
                                           command=self.toggle_files_section, 
                                           style='Sidebar.TButton', width=3)
         self.files_toggle_btn.pack()
-        self.ui_utils.bind_hover_cursor(self.files_toggle_btn)
         self.ui_utils.add_tooltip(self.files_toggle_btn, "Toggle Files Panel")
         
         # Chat history icon (clickable) - attached below files toggle
@@ -423,7 +469,6 @@ class WorkflowAutomator:
                                 command=self.refresh_with_reset, 
                                 style='TButton')
         refresh_btn.pack(side=tk.RIGHT, padx=(0, 5))
-        self.ui_utils.bind_hover_cursor(refresh_btn)
         self.ui_utils.add_tooltip(refresh_btn, "Refresh Files")
         
         # Clear tokens button
@@ -431,7 +476,6 @@ class WorkflowAutomator:
                                      command=self.clear_token_history,
                                      style='TButton')
         clear_tokens_btn.pack(side=tk.RIGHT, padx=(0, 5))
-        self.ui_utils.bind_hover_cursor(clear_tokens_btn)
         self.ui_utils.add_tooltip(clear_tokens_btn, "Clear Token History")
         
         # Current model indicator (right)
@@ -443,6 +487,8 @@ class WorkflowAutomator:
     
     def setup_chat_history_panel(self, main_frame):
         """Create the expandable chat history panel with session list"""
+        colors = self.theme_manager.colors
+        
         self.history_frame = ttk.Frame(main_frame, style='Card.TFrame')
         # Don't grid yet - will be shown when toggled
         
@@ -462,14 +508,12 @@ class WorkflowAutomator:
                                     command=self.start_new_session,
                                     style='Accent.TButton')
         new_session_btn.pack(side=tk.LEFT, padx=2)
-        self.ui_utils.bind_hover_cursor(new_session_btn)
         self.ui_utils.add_tooltip(new_session_btn, "Start New Session")
         
         clear_history_btn = ttk.Button(history_buttons, text="Clear All",
                                       command=self.clear_chat_history,
                                       style='TButton')
         clear_history_btn.pack(side=tk.LEFT, padx=2)
-        self.ui_utils.bind_hover_cursor(clear_history_btn)
         self.ui_utils.add_tooltip(clear_history_btn, "Clear All Sessions")
         
         # Session list with scrollbar - no padding for full width
@@ -481,46 +525,73 @@ class WorkflowAutomator:
         canvas_frame.pack(fill=tk.BOTH, expand=True, padx=0, pady=0)  # No padding
         
         sessions_canvas = tk.Canvas(canvas_frame, 
-                                   bg=self.theme_manager.colors['bg_primary'],
+                                   bg=colors['bg_primary'],
                                    highlightthickness=0,
                                    borderwidth=0)
         
         sessions_scrollbar = CustomScrollbar(canvas_frame, orient=tk.VERTICAL, 
                                             command=sessions_canvas.yview)
-        self.sessions_container = tk.Frame(sessions_canvas, bg=self.theme_manager.colors['bg_primary'])
+        self.sessions_container = tk.Frame(sessions_canvas, bg=colors['bg_primary'])
         
-        self.sessions_container.bind(
-            "<Configure>",
-            lambda e: sessions_canvas.configure(scrollregion=sessions_canvas.bbox("all"))
-        )
+        self.ui_utils.track_scrollregion(sessions_canvas, self.sessions_container)
         
         # Create window that fills the canvas width
         canvas_window = sessions_canvas.create_window((0, 0), window=self.sessions_container, anchor="nw")
         
-        # Configure the frame to match canvas width
-        def configure_frame_width(event=None):
-            canvas_width = sessions_canvas.winfo_width()
-            sessions_canvas.itemconfig(canvas_window, width=canvas_width)
+        # Configure the frame to match canvas width - resize bursts apply once per idle pass
+        pending_width = [None]
+        
+        def apply_frame_width():
+            sessions_canvas.itemconfig(canvas_window, width=pending_width[0])
+            pending_width[0] = None
+            self.schedule_session_render()  # Height may have changed too
+        
+        def configure_frame_width(event):
+            if pending_width[0] is None:
+                sessions_canvas.after_idle(apply_frame_width)
+            pending_width[0] = event.width
+        
+        # Every view change may bring other sessions into view
+        def on_sessions_yview(top, bottom):
+            sessions_scrollbar.set(top, bottom)
+            self.schedule_session_render()
         
         sessions_canvas.bind('<Configure>', configure_frame_width)
-        sessions_canvas.configure(yscrollcommand=sessions_scrollbar.set)
+        sessions_canvas.configure(yscrollcommand=on_sessions_yview)
+        self.sessions_canvas = sessions_canvas
         
         sessions_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         sessions_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Bind mousewheel to canvas
-        def on_sessions_mousewheel(event):
-            sessions_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
-            sessions_scrollbar.show_scrollbar()
-        
-        sessions_canvas.bind("<MouseWheel>", on_sessions_mousewheel)
-        
-        # Store session widgets for management
-        self.session_widgets = []
-        self.current_session_widget = None
+        sessions_scrollbar.attach_target(sessions_canvas)
+        
+        # Only sessions inside the viewport get a row: session_widgets maps
+        # list position -> row, and rows scrolled out of view are unplaced
+        # into the pool and reused instead of destroyed
+        self.session_list = []  # Newest first
+        self.session_widgets = {}
+        self.session_widget_pool = []
+        self.session_slot_height = None  # Measured from the first row built
+        self.session_render_pending = False
+        
+        # Row widget path -> row, for the SessionRow class bindings
+        self.session_rows_by_widget = {}
+        self.session_hover_rows = {}  # Rows waiting for their idle hover repaint
+        self.root.bind_class(self.SESSION_ROW_BINDTAG, "<Enter>", self.on_session_enter)
+        self.root.bind_class(self.SESSION_ROW_BINDTAG, "<Leave>", self.on_session_leave)
+        self.root.bind_class(self.SESSION_ROW_BINDTAG, "<Button-1>", self.on_session_click)
+        # Empty state, placed only while the project has no sessions
+        self.sessions_empty_label = ttk.Label(self.sessions_container, 
+                                              text="No sessions yet.\nClick 'New' to start!",
+                                              style='Secondary.TLabel',
+                                              justify='center')
+        self.current_session_row = None  # Row showing the active session, if visible
     
     def setup_selected_section(self, container):
         """Set up the Selected for Analysis section"""
+        colors = self.theme_manager.colors
+        
         # Header
         selected_label_frame = ttk.Frame(container, style='TFrame')
         selected_label_frame.pack(fill=tk.X, padx=10, pady=(10, 5))
@@ -537,22 +608,18 @@ class WorkflowAutomator:
                                              command=self.toggle_selected_size, 
                                              style='TButton')
         self.expand_selected_btn.pack(side=tk.LEFT, padx=2)
-        self.ui_utils.bind_hover_cursor(self.expand_selected_btn)
         
         copy_all_btn = ttk.Button(button_frame, text="Copy All",
                                  command=self.copy_all_selected, style='TButton')
         copy_all_btn.pack(side=tk.LEFT, padx=2)
-        self.ui_utils.bind_hover_cursor(copy_all_btn)
         
         append_all_btn = ttk.Button(button_frame, text="Append All",
                                    command=self.append_all_files, style='TButton')
         append_all_btn.pack(side=tk.LEFT, padx=2)
-        self.ui_utils.bind_hover_cursor(append_all_btn)
         
         clear_all_btn = ttk.Button(button_frame, text="Clear All",
                                   command=self.clear_selection, style='TButton')
         clear_all_btn.pack(side=tk.LEFT, padx=2)
-        self.ui_utils.bind_hover_cursor(clear_all_btn)
         
         # Selected files text area
         selected_frame = ttk.Frame(container, style='TFrame')
@@ -566,8 +633,8 @@ class WorkflowAutomator:
             selected_text_frame, 
             wrap=tk.WORD, 
             font=self.theme_manager.fonts['code'],
-            bg=self.theme_manager.colors['chat_user'],
-            fg=self.theme_manager.colors['text_primary'],
+            bg=colors['chat_user'],
+            fg=colors['text_primary'],
             highlightthickness=0,
             borderwidth=0)
         self.selected_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -579,11 +646,17 @@ class WorkflowAutomator:
         self.selected_text.configure(yscrollcommand=selected_scrollbar.set)
         
         # Add mousewheel support
-        def on_selected_mousewheel(event):
-            self.selected_text.yview_scroll(int(-1*(event.delta/120)), "units")
-            selected_scrollbar.show_scrollbar()
+        selected_scrollbar.attach_target(self.selected_text)
+        
+        # The pane's stripped text, re-read only after the widget changes
+        self.selected_content = None
         
-        self.selected_text.bind("<MouseWheel>", on_selected_mousewheel)
+        def on_selected_modified(event):
+            if self.selected_text.edit_modified():
+                self.selected_content = None
+                self.selected_text.edit_modified(False)
+        
+        self.selected_text.bind("<<Modified>>", on_selected_modified)
         self.selected_text.insert('1.0', "No files selected for analysis")
     
     def setup_file_list_callbacks(self):
@@ -618,6 +691,18 @@ class WorkflowAutomator:
     
     # ========== EVENT HANDLERS ==========
     
+    def probe_claude(self):
+        """Check for the Claude Code CLI in a background thread"""
+        available = self.claude_runner.is_claude_available()
+        self.root.after(0, self.show_claude_status, available)
+    
+    def show_claude_status(self, available):
+        """Show the Claude Code CLI probe result in the header"""
+        if available:
+            self.claude_label.configure(text="🤖 Claude Code: Available")
+        else:
+            self.claude_label.configure(text="⚠️ Claude Code: Not Found")
+    
     def select_model(self, display_name):
         """Handle model selection from dropdown"""
         self.api_client.set_model(display_name)
@@ -630,41 +715,88 @@ class WorkflowAutomator:
         # Update token display for new model
         self.update_token_display()
         
-        # Update status to show selected model
+        # Update status to show selected model, auto-cleared after 3 seconds
         model_id = self.api_client.selected_model
-        self.status_var.set(f"Model changed to: {display_name} ({model_id})")
+        self.show_toast(f"Model changed to: {display_name} ({model_id})", 3000)
+    
+    def set_status(self, message):
+        """Show a lasting status message, cancelling any pending toast reset"""
+        if self.status_reset_id:
+            self.root.after_cancel(self.status_reset_id)
+            self.status_reset_id = None
+        self.status_var.set(message)
+    
+    def show_toast(self, message, duration=2000):
+        """Show a temporary status message, then reset to "Ready"
         
-        # Auto-clear status after 3 seconds
-        self.root.after(3000, lambda: self.status_var.set("Ready"))
+        A single reset timer is kept; each new message replaces the pending one.
+        """
+        self.set_status(message)
+        self.status_reset_id = self.root.after(duration, self.reset_status)
+    
+    def reset_status(self):
+        """Reset the status bar after a temporary message"""
+        self.status_reset_id = None
+        if self.status_var.get() != "Ready":
+            self.status_var.set("Ready")
     
     def update_token_display(self):
         """Update the token counter display"""
-        token_info = self.api_client.get_token_usage_info()
-        used = token_info['used']
-        limit = token_info['limit']
-        remaining = token_info['remaining']
-        percentage = token_info['percentage']
+        # The counter text only depends on the running session total and the model limit
+        state = (self.api_client.session_tokens, self.api_client.get_context_limit())
+        if state == self.last_token_state:
+            return
+        self.last_token_state = state
+        
+        used, limit = state
+        remaining = max(0, limit - used)
+        percentage = (used / limit) * 100 if limit > 0 else 0
         
         # Color code based on usage percentage
-        if percentage >= 90:
-            indicator = "🔴"  # Red - almost full
-        elif percentage >= 70:
-            indicator = "🟡"  # Yellow - getting full
-        else:
-            indicator = "🟢"  # Green - plenty of space
+        indicator = next(mark for threshold, mark in self.TOKEN_INDICATORS if percentage >= threshold)
         
         self.token_var.set(f"{indicator} Tokens: {used:,}/{limit:,} ({remaining:,} left)")
     
+    def schedule_token_display(self):
+        """Refresh the token counter when Tk is idle; repeated requests share one refresh"""
+        if not self.token_display_pending:
+            self.token_display_pending = True
+            self.root.after_idle(self.flush_token_display)
+    
+    def flush_token_display(self):
+        """Run the scheduled token counter refresh"""
+        self.token_display_pending = False
+        self.update_token_display()
+    
     def clear_token_history(self):
         """Clear token usage history"""
         self.api_client.reset_session_tokens()
         self.update_token_display()
-        self.status_var.set("Token history cleared")
-        self.root.after(2000, lambda: self.status_var.set("Ready"))
+        self.show_toast("Token history cleared")
+    
+    def schedule_history_refresh(self):
+        """Refresh the session list when Tk is idle; repeated requests share one refresh
+        
+        While the history panel is hidden the list is only marked dirty and
+        rebuilt the next time the panel opens.
+        """
+        if self.history_section_collapsed:
+            self.history_dirty = True
+        elif not self.history_refresh_pending:
+            self.history_refresh_pending = True
+            self.root.after_idle(self.flush_history_refresh)
+    
+    def flush_history_refresh(self):
+        """Run the scheduled session list refresh"""
+        self.history_refresh_pending = False
+        if self.history_section_collapsed:
+            self.history_dirty = True  # Panel was hidden before the refresh ran
+        else:
+            self.refresh_chat_history_display()
     
     def refresh_chat_history_display(self):
         """Refresh the session list display"""
-        if not hasattr(self, 'sessions_container'):
+        if self.history_frame is None:
             return
         
         # Load project sessions if needed
@@ -672,97 +804,232 @@ class WorkflowAutomator:
             print(f"Loading sessions for project: {self.project_path}")
             self.chat_history_manager.load_project_sessions(self.project_path)
         
-        # Clear existing session widgets
-        for widget in self.session_widgets:
-            widget.destroy()
-        self.session_widgets.clear()
-        self.current_session_widget = None
+        self.current_session_row = None
         
-        # Get sessions for current project
+        # Get sessions for current project, displayed newest first
         sessions = self.chat_history_manager.get_project_sessions()
+        session_list = self.session_list = list(reversed(sessions))
+        
+        # Reconfigure rows that stay in range; render_visible_sessions
+        # fills in the rest for the current viewport
+        rows = self.session_widgets
+        for index in list(rows):
+            if index < len(session_list):
+                self.configure_session_widget(rows[index], session_list[index])
+            else:
+                self.release_session_widget(index)
         
-        if not sessions:
+        if not session_list:
             # Show empty state
-            empty_label = ttk.Label(self.sessions_container, 
-                                   text="No sessions yet.\nClick 'New' to start!",
-                                   style='Secondary.TLabel',
-                                   justify='center')
-            empty_label.pack(pady=20)
-            self.session_widgets.append(empty_label)
-        else:
-            # Display sessions in reverse order (newest first)
-            for session in reversed(sessions):
-                session_widget = self.create_session_widget(session)
-                self.session_widgets.append(session_widget)
-    
-    def create_session_widget(self, session):
-        """Create a widget for a chat session"""
-        # Session container - full width edge to edge
+            self.sessions_empty_label.place(relx=0.5, y=20, anchor='n')
+            self.sessions_container.configure(height=80)
+            return
+        self.sessions_empty_label.place_forget()
+        
+        if self.session_slot_height is None:
+            self.session_widget_pool.append(self.create_session_widget())
+        
+        # The container is as tall as the full list so the scrollbar reflects it
+        self.sessions_container.configure(height=len(session_list) * self.session_slot_height)
+        self.render_visible_sessions()
+    
+    def schedule_session_render(self):
+        """Render the visible sessions when Tk is idle; repeated requests share one pass"""
+        if not self.session_render_pending:
+            self.session_render_pending = True
+            self.root.after_idle(self.render_visible_sessions)
+    
+    def render_visible_sessions(self):
+        """Place rows for the sessions in the viewport, recycling the others"""
+        self.session_render_pending = False
+        session_list = self.session_list
+        slot = self.session_slot_height
+        if not session_list or slot is None:
+            return
+        
+        canvas = self.sessions_canvas
+        top = int(canvas.canvasy(0))
+        first = max(0, top // slot)
+        last = min(len(session_list), (top + canvas.winfo_height()) // slot + 1)
+        
+        rows = self.session_widgets
+        for index in list(rows):
+            if not first <= index < last:
+                self.release_session_widget(index)
+        
+        pool = self.session_widget_pool
+        for index in range(first, last):
+            if index in rows:
+                continue
+            row = pool.pop() if pool else self.create_session_widget()
+            rows[index] = row
+            self.configure_session_widget(row, session_list[index])
+            row['frame'].place(x=0, y=index * slot + 1, relwidth=1, height=slot - 2)
+    
+    def release_session_widget(self, index):
+        """Unplace the row shown at index and return it to the pool"""
+        row = self.session_widgets.pop(index)
+        row['frame'].place_forget()
+        if row is self.current_session_row:
+            self.current_session_row = None
+        self.session_widget_pool.append(row)
+    
+    def create_session_widget(self):
+        """Create an unplaced session row; configure_session_widget fills it in"""
+        colors = self.theme_manager.colors
+        fonts = self.theme_manager.fonts
+        bg = colors['bg_tertiary']
+        
+        # Session container - full width edge to edge, placed by render_visible_sessions
         session_frame = tk.Frame(self.sessions_container, 
-                                bg=self.theme_manager.colors['bg_tertiary'],
+                                bg=bg,
                                 relief='flat',
                                 bd=0,
-                                highlightthickness=0)
-        session_frame.pack(fill=tk.BOTH, padx=0, pady=1)  # Use BOTH to ensure full width
+                                highlightthickness=0,
+                                cursor="hand2")
         
         # Session info frame with padding for text
-        info_frame = tk.Frame(session_frame, bg=self.theme_manager.colors['bg_tertiary'])
+        info_frame = tk.Frame(session_frame, bg=bg, cursor="hand2")
         info_frame.pack(fill=tk.BOTH, padx=15, pady=10)  # Padding only for the text content
         
         # Session name
         name_label = tk.Label(info_frame,
-                             text=session.session_name,
-                             font=self.theme_manager.fonts['default'],
-                             fg=self.theme_manager.colors['text_primary'],
-                             bg=self.theme_manager.colors['bg_tertiary'],
-                             anchor='w')
+                             font=fonts['default'],
+                             fg=colors['text_primary'],
+                             bg=bg,
+                             anchor='w',
+                             cursor="hand2")
         name_label.pack(fill=tk.X)
         
         # Session details (date and time only)
-        details_text = session.get_formatted_date()
         details_label = tk.Label(info_frame,
-                                text=details_text,
-                                font=self.theme_manager.fonts['small'],
-                                fg=self.theme_manager.colors['text_secondary'],
-                                bg=self.theme_manager.colors['bg_tertiary'],
-                                anchor='w')
+                                font=fonts['small'],
+                                fg=colors['text_secondary'],
+                                bg=bg,
+                                anchor='w',
+                                cursor="hand2")
         details_label.pack(fill=tk.X)
         
-        # Hover effects
-        def on_enter(event):
-            session_frame.config(bg=self.theme_manager.colors['bg_secondary'])
-            info_frame.config(bg=self.theme_manager.colors['bg_secondary'])
-            name_label.config(bg=self.theme_manager.colors['bg_secondary'])
-            details_label.config(bg=self.theme_manager.colors['bg_secondary'])
-        
-        def on_leave(event):
-            # Don't change if this is the active session
-            if session_frame != self.current_session_widget:
-                session_frame.config(bg=self.theme_manager.colors['bg_tertiary'])
-                info_frame.config(bg=self.theme_manager.colors['bg_tertiary'])
-                name_label.config(bg=self.theme_manager.colors['bg_tertiary'])
-                details_label.config(bg=self.theme_manager.colors['bg_tertiary'])
-        
-        def on_click(event):
-            self.switch_to_session(session.session_id, session_frame)
-        
-        # Bind events to all components
+        if self.session_slot_height is None:
+            # Every row has the same height: both label lines, the info frame
+            # padding and a 1px gap above and below
+            self.session_slot_height = (name_label.winfo_reqheight() +
+                                        details_label.winfo_reqheight() + 2 * 10 + 2)
+        
+        row = {
+            'frame': session_frame,
+            'info_frame': info_frame,
+            'name_label': name_label,
+            'details_label': details_label,
+            'session_id': None,
+            'hover': False,
+            'bg': None,  # Last background painted
+            'rendered': None  # (session_id, name, date, is current) last shown
+        }
+        
+        # Hover and click are handled by the shared SessionRow class bindings
         for widget in [session_frame, info_frame, name_label, details_label]:
-            widget.bind("<Enter>", on_enter)
-            widget.bind("<Leave>", on_leave)
-            widget.bind("<Button-1>", on_click)
-            widget.config(cursor="hand2")
+            self.session_rows_by_widget[str(widget)] = row
+            widget.bindtags((str(widget), self.SESSION_ROW_BINDTAG) + widget.bindtags()[1:])
         
-        # Highlight if this is the current session
-        if (self.chat_history_manager.current_session and 
-            session.session_id == self.chat_history_manager.current_session.session_id):
-            self.current_session_widget = session_frame
-            session_frame.config(bg=self.theme_manager.colors['accent'])
-            info_frame.config(bg=self.theme_manager.colors['accent'])
-            name_label.config(bg=self.theme_manager.colors['accent'], fg='white')
-            details_label.config(bg=self.theme_manager.colors['accent'], fg='white')
+        return row
+    
+    def on_session_enter(self, event):
+        """Hover highlight for the session row under the pointer"""
+        self.queue_session_hover(self.session_rows_by_widget[str(event.widget)], True)
+    
+    def on_session_leave(self, event):
+        self.queue_session_hover(self.session_rows_by_widget[str(event.widget)], False)
+    
+    def queue_session_hover(self, row, hover):
+        """Record a row's hover state and repaint it once Tk is idle
+        
+        Moving between a row's own widgets fires Leave/Enter pairs; painting
+        at idle means only the final state of each row reaches Tk.
+        """
+        row['hover'] = hover
+        if not self.session_hover_rows:
+            self.root.after_idle(self.flush_session_hover)
+        self.session_hover_rows[str(row['frame'])] = row
+    
+    def flush_session_hover(self):
+        rows = self.session_hover_rows
+        self.session_hover_rows = {}
+        for row in rows.values():
+            bg = self.session_row_background(row)
+            if bg != row['bg']:
+                self.paint_session_row(row, bg)
+    
+    def session_row_background(self, row):
+        """Background for a row: hover wins over the active-session highlight"""
+        colors = self.theme_manager.colors
+        if row['hover']:
+            return colors['bg_secondary']
+        if row is self.current_session_row:
+            return colors['accent']
+        return colors['bg_tertiary']
+    
+    def paint_session_row(self, row, bg):
+        """Set the background of all four widgets of a session row"""
+        row['bg'] = bg
+        for key in ('frame', 'info_frame', 'name_label', 'details_label'):
+            row[key].config(bg=bg)
+    
+    def paint_session_selection(self, row):
+        """Repaint a row's background and label colours after the active session changed"""
+        colors = self.theme_manager.colors
+        if row is self.current_session_row:
+            name_fg = details_fg = 'white'
+        else:
+            name_fg = colors['text_primary']
+            details_fg = colors['text_secondary']
+        
+        bg = row['bg'] = self.session_row_background(row)
+        row['frame'].config(bg=bg)
+        row['info_frame'].config(bg=bg)
+        row['name_label'].config(bg=bg, fg=name_fg)
+        row['details_label'].config(bg=bg, fg=details_fg)
+    
+    def on_session_click(self, event):
+        # Rows are reused, so the session comes from the row at click time
+        row = self.session_rows_by_widget[str(event.widget)]
+        self.switch_to_session(row['session_id'], row)
+    
+    def configure_session_widget(self, row, session):
+        """Show a session in a (possibly reused) session row
+        
+        Rows already showing the same session in the same state are left alone,
+        so a refresh only touches the rows whose content moved or changed.
+        """
+        current_session = self.chat_history_manager.current_session
+        is_current = bool(current_session and session.session_id == current_session.session_id)
+        if is_current:
+            self.current_session_row = row
+        elif row is self.current_session_row:
+            self.current_session_row = None  # Row now shows another session
+        
+        rendered = (session.session_id, session.session_name, session.get_formatted_date(), is_current)
+        if row['rendered'] == rendered:
+            return
+        row['rendered'] = rendered
+        row['session_id'] = session.session_id
+        colors = self.theme_manager.colors
         
-        return session_frame
+        # Highlight if this is the current session
+        if is_current:
+            bg = colors['accent']
+            name_fg = details_fg = 'white'
+        else:
+            bg = colors['bg_tertiary']
+            name_fg = colors['text_primary']
+            details_fg = colors['text_secondary']
+        
+        row['hover'] = False  # A recycled row starts without the pointer on it
+        row['bg'] = bg
+        row['frame'].config(bg=bg)
+        row['info_frame'].config(bg=bg)
+        row['name_label'].config(text=session.session_name, bg=bg, fg=name_fg)
+        row['details_label'].config(text=session.get_formatted_date(), bg=bg, fg=details_fg)
     
     def start_new_session(self):
         """Start a new chat session"""
@@ -774,72 +1041,46 @@ class WorkflowAutomator:
         new_session = self.chat_history_manager.start_new_session()
         
         # Refresh the display
-        self.refresh_chat_history_display()
+        self.schedule_history_refresh()
         
         # Clear the analysis panel for the new session
         if hasattr(self.analysis_panel, 'clear_chat'):
             self.analysis_panel.clear_chat()
         
-        self.status_var.set("Started new chat session")
-        self.root.after(2000, lambda: self.status_var.set("Ready"))
+        self.show_toast("Started new chat session")
     
-    def switch_to_session(self, session_id, session_widget):
+    def switch_to_session(self, session_id, row):
         """Switch to a specific session"""
         # Switch session in the chat history manager
         session = self.chat_history_manager.switch_to_session(session_id)
         
         if session:
-            # Update visual selection
-            if self.current_session_widget:
-                # Reset previous selection
-                self.current_session_widget.config(bg=self.theme_manager.colors['bg_tertiary'])
-                old_widgets = self.current_session_widget.winfo_children()
-                if old_widgets:
-                    info_frame = old_widgets[0]
-                    info_frame.config(bg=self.theme_manager.colors['bg_tertiary'])
-                    info_widgets = info_frame.winfo_children()
-                    
-                    for widget in info_widgets:
-                        widget.config(bg=self.theme_manager.colors['bg_tertiary'])
-                        if widget.winfo_class() == 'Label':
-                            if len(str(widget.cget('text'))) < 20:  # Name label (shorter text)
-                                widget.config(fg=self.theme_manager.colors['text_primary'])
-                            else:  # Details label (longer text with date)
-                                widget.config(fg=self.theme_manager.colors['text_secondary'])
-            
-            # Highlight new selection
-            self.current_session_widget = session_widget
-            session_widget.config(bg=self.theme_manager.colors['accent'])
-            widgets = session_widget.winfo_children()
-            if widgets:
-                info_frame = widgets[0]
-                info_frame.config(bg=self.theme_manager.colors['accent'])
-                info_widgets = info_frame.winfo_children()
-                
-                for widget in info_widgets:
-                    widget.config(bg=self.theme_manager.colors['accent'], fg='white')
+            # Update visual selection through the rows' stored widget references
+            previous_row = self.current_session_row
+            self.current_session_row = row
+            if previous_row is not None and previous_row is not row:
+                self.paint_session_selection(previous_row)
+            row['hover'] = False  # Show the selection colour right away
+            self.paint_session_selection(row)
             
             # Load session chat history into analysis panel
             if hasattr(self.analysis_panel, 'display_session_history'):
                 self.analysis_panel.display_session_history(session)
             
-            self.status_var.set(f"Switched to session: {session.session_name}")
-            self.root.after(2000, lambda: self.status_var.set("Ready"))
+            self.show_toast(f"Switched to session: {session.session_name}")
     
     def clear_chat_history(self):
         """Clear chat history for current project"""
         if not self.project_path:
-            self.status_var.set("No project loaded")
+            self.set_status("No project loaded")
             return
         
         self.chat_history_manager.clear_current_project_history()
-        self.refresh_chat_history_display()
-        self.status_var.set("Chat history cleared")
-        self.root.after(2000, lambda: self.status_var.set("Ready"))
+        self.schedule_history_refresh()
+        self.show_toast("Chat history cleared")
     
     def auto_detect_project(self):
         """Auto-detect current working directory as project if it's a git repo"""
-        import os
         current_dir = os.getcwd()
         
         # Check if current directory is a git repository
@@ -848,11 +1089,9 @@ class WorkflowAutomator:
             self.project_path = current_dir
             self.chat_history_manager.load_project_sessions(current_dir)
             
-            # Refresh display if history panel is visible
-            if not self.history_section_collapsed:
-                self.refresh_chat_history_display()
+            self.schedule_history_refresh()
             
-            self.status_var.set(f"Auto-detected project: {os.path.basename(current_dir)}")
+            self.set_status(f"Auto-detected project: {os.path.basename(current_dir)}")
     
     def browse_project(self):
         """Browse for project directory"""
@@ -863,6 +1102,7 @@ class WorkflowAutomator:
             self.project_path = directory
             # Load chat history for this project
             self.chat_history_manager.load_project_sessions(directory)
+            self.schedule_history_refresh()
             self.refresh_changed_files()
     
     def refresh_with_reset(self):
@@ -878,33 +1118,30 @@ class WorkflowAutomator:
         # Clear file data
         self.changed_files.clear()
         self.selected_files.clear()
-        self.file_manager.exclude_paths.clear()
+        self.selected_positions.clear()
+        self.file_manager.clear_exclude_paths()
+        self.file_widgets_pending = False
         
         # Clear UI
         if self.file_list_panel:
             self.file_list_panel.clear_all()
         
-        self.selected_text.delete('1.0', tk.END)
-        self.selected_text.insert('1.0', "No files selected for analysis")
+        self.update_selected_display()
         
         if self.analysis_panel:
             self.analysis_panel.clear_chat()
         
         # Set button to loading state (red)
         self.set_button_loading()
-        self.status_var.set("Loading new project...")
+        self.set_status("Loading new project...")
     
     def set_button_green(self):
-        """Set the toggle button to green (loaded) state"""
+        """Set the toggle button to green (loaded) state; Tk repaints it at idle"""
         self.files_toggle_btn.configure(style='SidebarLoaded.TButton')
-        self.files_toggle_btn.update()
-        self.root.update()
     
     def set_button_loading(self):
-        """Set the toggle button to red (loading) state"""
+        """Set the toggle button to red (loading) state; Tk repaints it at idle"""
         self.files_toggle_btn.configure(style='SidebarLoading.TButton')
-        self.files_toggle_btn.update()
-        self.root.update()
     
     def refresh_changed_files(self):
         """Get changed files from git and update UI"""
@@ -912,68 +1149,89 @@ class WorkflowAutomator:
             messagebox.showwarning("Warning", "Please select a project path first")
             return
         
+        self.set_button_loading()
+        self.set_status("Refreshing changed files...")
+        
+        # Git and path work run in a worker; widgets are only touched on the Tk thread
+        self.refresh_generation += 1
+        self.io_pool.submit(self.load_changed_files, self.project_path, self.refresh_generation)
+    
+    def load_changed_files(self, project_path, generation):
+        """Run git status and build ChangedFile objects in a background thread"""
         try:
-            self.set_button_loading()
-            self.status_var.set("Refreshing changed files...")
-            
-            # Get changed files from git
-            result, error = self.git_manager.get_changed_files(self.project_path)
-            
-            if error:
-                messagebox.showerror("Error", error)
-                self.status_var.set("Error getting changed files")
-                self.files_toggle_btn.configure(style='Sidebar.TButton')
-                return
-            
-            # Parse the git output
-            self.parse_and_create_files(result)
+            result, error = self.git_manager.get_changed_files(project_path)
+            files = None if error else self.parse_and_create_files(result)
+        except Exception as e:
+            files, error = None, f"Failed to refresh files: {e}"
+        
+        self.root.after(0, self.finish_refresh, generation, files, error)
+    
+    def finish_refresh(self, generation, files, error):
+        """Apply refreshed files to the UI (Tk thread)"""
+        if generation != self.refresh_generation:
+            return  # Superseded by a newer refresh
+        
+        if error:
+            messagebox.showerror("Error", error)
+            self.set_status("Error getting changed files")
+            self.files_toggle_btn.configure(style='Sidebar.TButton')
+            return
+        
+        try:
+            self.changed_files.clear()
+            self.changed_files.update((f.rel_path, f) for f in files)
             
             # Update UI
             self.create_file_widgets()
-            self.status_var.set(f"Found {len(self.changed_files)} changed files")
+            self.set_status(f"Found {len(self.changed_files)} changed files")
             
             # Update button color
             if len(self.changed_files) > 0:
-                self.root.after(10, self.set_button_green)
+                self.set_button_green()
             else:
                 self.files_toggle_btn.configure(style='Sidebar.TButton')
                 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to refresh files: {e}")
-            self.status_var.set("Error")
+            self.set_status("Error")
             self.files_toggle_btn.configure(style='Sidebar.TButton')
     
     def parse_and_create_files(self, git_output):
-        """Parse git output and create ChangedFile objects"""
-        self.changed_files.clear()
+        """Parse git output into a list of ChangedFile objects (no Tk access)"""
+        changed_files = []
+        dir_entries = {}  # Parent directory -> {name: is_dir}, one scandir per directory
         
-        lines = git_output.strip().split('\n') if git_output.strip() else []
+        # Loop invariants bound once
+        root_prefix = os.path.join(self.git_manager.repo_root, '')  # Ends with a separator
+        is_excluded = self.file_manager.is_path_excluded
+        split, intern = os.path.split, sys.intern
         
-        for line in lines:
-            if not line.strip():
-                continue
-            
-            status, filepath = self.git_manager.parse_porcelain_line(line)
-            
-            if status is None or filepath is None:
-                continue
-            
-            if self.file_manager.is_path_excluded(filepath):
+        for status, filepath in self.git_manager.parse_porcelain_output(git_output):
+            if is_excluded(filepath):
                 continue
             
             # Create paths
-            abs_path = os.path.join(self.git_manager.repo_root, filepath)
+            abs_path = root_prefix + filepath  # Same as os.path.join for relative paths
             
-            # Skip directories
-            if os.path.exists(abs_path) and os.path.isdir(abs_path):
-                continue
+            # Skip directories (missing files are kept - they were deleted/renamed)
+            parent, name = split(abs_path.rstrip('/\\'))
+            entries = dir_entries.get(parent)
+            if entries is None:
+                try:
+                    with os.scandir(parent) as it:
+                        entries = {entry.name: entry.is_dir() for entry in it}
+                except OSError:
+                    entries = {}
+                dir_entries[parent] = entries
             
-            try:
-                rel_path = Path(abs_path).relative_to(Path(self.git_manager.repo_root)).as_posix()
-                changed_file = ChangedFile(abs_path, rel_path, status)
-                self.changed_files.append(changed_file)
-            except Exception:
+            if entries.get(name):
                 continue
+            
+            # Porcelain paths are already repo-relative with forward slashes.
+            # Interned so repeated refreshes share one string per path/status
+            changed_files.append(ChangedFile(abs_path, intern(filepath), intern(status)))
+        
+        return changed_files
     
     def create_file_widgets(self):
         """Create UI widgets for each changed file"""
@@ -983,9 +1241,19 @@ class WorkflowAutomator:
         # Clear existing widgets
         self.file_list_panel.clear_all()
         
-        # Create widgets for each file
-        for i, file_obj in enumerate(self.changed_files):
-            self.file_list_panel.create_file_widget(file_obj, i, self.file_list_callbacks)
+        # Nothing is visible while collapsed - build on expand instead
+        if self.files_section_collapsed:
+            self.file_widgets_pending = True
+            return
+        self.file_widgets_pending = False
+        
+        # Create widgets for each file while the list is unmapped
+        self.file_list_panel.begin_bulk()
+        try:
+            for i, file_obj in enumerate(self.changed_files.values()):
+                self.file_list_panel.create_file_widget(file_obj, i, self.file_list_callbacks)
+        finally:
+            self.file_list_panel.end_bulk()
     
     def toggle_files_section(self):
         """Toggle the horizontal visibility of the Changed Files section"""
@@ -996,6 +1264,9 @@ class WorkflowAutomator:
             self.main_paned.paneconfigure(self.file_list_panel.frame, minsize=400)
             self.files_toggle_btn.config(text="◀")
             self.files_section_collapsed = False
+            
+            if self.file_widgets_pending:
+                self.create_file_widgets()
         else:
             # Collapse the left panel
             self.main_paned.forget(self.file_list_panel.frame)
@@ -1016,6 +1287,9 @@ class WorkflowAutomator:
     def toggle_history_section(self):
         """Toggle the chat history panel visibility in the main paned window"""
         if self.history_section_collapsed:
+            if self.history_frame is None:
+                self.setup_chat_history_panel(self.main_frame)
+            
             # Add history panel to the left side of the paned window
             panes = self.main_paned.panes()
             if panes:
@@ -1036,8 +1310,10 @@ class WorkflowAutomator:
             self.history_icon.config(foreground='#10a37f')  # Green accent color
             self.history_section_collapsed = False
             
-            # Load and display history
-            self.refresh_chat_history_display()
+            # Load and display history if it changed while hidden
+            if self.history_dirty:
+                self.history_dirty = False
+                self.refresh_chat_history_display()
         else:
             # Hide history panel from paned window
             self.main_paned.forget(self.history_frame)
@@ -1052,43 +1328,52 @@ class WorkflowAutomator:
         path = file_obj.rel_path if relative else file_obj.abs_path
         if self.ui_utils.copy_to_clipboard(path):
             path_type = "relative" if relative else "absolute"
-            self.status_var.set(f"Copied {path_type} path: {path}")
+            self.set_status(f"Copied {path_type} path: {path}")
     
     def copy_and_append(self, file_obj):
         """One-click: copy path + show content + add to analysis"""
         # Copy path
         self.ui_utils.copy_to_clipboard(file_obj.rel_path)
         
-        # Load content if not already loaded
+        # Load content in thread if not already loaded
         if not file_obj.content_preview and not file_obj.error:
-            self.file_manager.load_file_content(file_obj)
-        
-        # Add to analysis
+            self.io_pool.submit(self.load_and_append, file_obj)
+        else:
+            self.finish_append(file_obj)
+    
+    def load_and_append(self, file_obj):
+        """Load content in background thread, then add to analysis in UI"""
+        self.file_manager.load_file_content(file_obj)
+        self.root.after(0, self.finish_append, file_obj)
+    
+    def finish_append(self, file_obj):
+        """Add a loaded file to analysis (Tk thread)"""
+        # The file may have been removed, or the list refreshed, while it loaded
+        if self.changed_files.get(file_obj.rel_path) is not file_obj:
+            return
         self.add_to_analysis(file_obj)
-        self.status_var.set("Appended for analysis")
+        self.set_status("Appended for analysis")
     
     def toggle_content(self, file_obj, index):
         """Toggle file content display"""
         if file_obj.expanded:
             self.file_list_panel.hide_file_content(file_obj)
         else:
-            # Load content in thread
-            threading.Thread(target=self.load_and_show_content, 
-                           args=(file_obj,), daemon=True).start()
+            # Load content on a pooled worker thread
+            self.io_pool.submit(self.load_and_show_content, file_obj)
     
     def load_and_show_content(self, file_obj):
         """Load content in background thread and show in UI"""
         file_obj.loading = True
         
         # Update UI to show loading
-        self.root.after(0, lambda: file_obj.widgets['show_btn'].config(
-            text="Loading...", state='disabled'))
+        self.root.after(0, self.file_list_panel.show_loading, file_obj)
         
         # Load content
         success = self.file_manager.load_file_content(file_obj)
         
         # Update UI in main thread
-        self.root.after(0, lambda: self.file_list_panel.show_file_content(file_obj))
+        self.root.after(0, self.file_list_panel.show_file_content, file_obj)
     
     def toggle_selection(self, file_obj, var):
         """Toggle file selection for analysis"""
@@ -1097,106 +1382,205 @@ class WorkflowAutomator:
         else:
             self.remove_from_analysis(file_obj)
     
-    def add_to_analysis(self, file_obj):
-        """Add file to analysis pane"""
-        if file_obj not in self.selected_files:
-            self.selected_files.append(file_obj)
+    def add_to_analysis(self, file_obj, defer_display=False):
+        """Add file to analysis pane (defer_display skips the pane update for bulk adds)"""
+        if file_obj.rel_path not in self.selected_files:
+            self.selected_positions[file_obj.rel_path] = len(self.selected_files)
+            self.selected_files[file_obj.rel_path] = file_obj
             file_obj.selected_for_analysis = True
             
             # Auto-check the selection checkbox
             if 'select_var' in file_obj.widgets:
                 file_obj.widgets['select_var'].set(True)
-        
-        self.update_selected_display()
+            
+            if not defer_display:
+                self.append_selected_blocks([file_obj])
     
     def remove_from_analysis(self, file_obj):
         """Remove file from analysis pane"""
-        if file_obj in self.selected_files:
-            self.selected_files.remove(file_obj)
-            file_obj.selected_for_analysis = False
-        
-        self.update_selected_display()
+        popped = self.pop_selected(file_obj)
+        if popped is not None:
+            position, selected = popped
+            file_obj.selected_for_analysis = selected.selected_for_analysis = False
+            self.remove_selected_block(selected, position)
     
     def remove_file(self, file_obj):
         """Remove file from the changed files list"""
         try:
-            if file_obj in self.selected_files:
-                self.selected_files.remove(file_obj)
-                self.update_selected_display()
+            popped = self.pop_selected(file_obj)
+            if popped is not None:
+                position, selected = popped
+                self.remove_selected_block(selected, position)
             
-            if file_obj in self.changed_files:
-                self.changed_files.remove(file_obj)
+            self.changed_files.pop(file_obj.rel_path, None)
             
             if hasattr(file_obj, 'widgets') and 'frame' in file_obj.widgets:
                 file_obj.widgets['frame'].destroy()
             
             # Add to exclude list
-            self.file_manager.exclude_paths.append(file_obj.rel_path)
+            self.file_manager.add_exclude_path(file_obj.rel_path)
             
-            self.status_var.set(f"Removed: {file_obj.rel_path}")
+            self.set_status(f"Removed: {file_obj.rel_path}")
             
         except Exception as e:
             messagebox.showerror("Error", f"Failed to remove file: {e}")
     
+    def pop_selected(self, file_obj):
+        """Drop file_obj's path from selected_files
+        
+        Returns (former position, the selected object) or None if the path
+        wasn't selected.
+        """
+        selected = self.selected_files.pop(file_obj.rel_path, None)
+        if selected is None:
+            return None
+        return self.selected_positions.pop(file_obj.rel_path), selected
+    
+    def get_selected_content(self):
+        """Stripped text of the Selected pane ("" for the empty-state message)
+        
+        Cached until the widget reports a modification, so repeated copy and
+        send clicks don't pull a large buffer out of Tk again.
+        """
+        if self.selected_content is None:
+            content = self.selected_text.get('1.0', tk.END).strip()
+            if content == "No files selected for analysis":
+                content = ""
+            self.selected_content = content
+        return self.selected_content
+    
     def copy_all_selected(self):
         """Copy all selected files content to clipboard"""
-        content = self.selected_text.get('1.0', tk.END).strip()
-        if content and content != "No files selected for analysis":
+        content = self.get_selected_content()
+        if content:
             if self.ui_utils.copy_to_clipboard(content):
-                self.status_var.set("All selected files copied to clipboard")
-                self.root.after(2000, lambda: self.status_var.set("Ready"))
+                self.show_toast("All selected files copied to clipboard")
         else:
-            self.status_var.set("No content to copy")
+            self.set_status("No content to copy")
     
     def append_all_files(self):
         """Add all visible changed files to analysis"""
-        added_count = 0
-        for file_obj in self.changed_files:
-            if file_obj not in self.selected_files:
-                # Load content if not already loaded
-                if not file_obj.content_preview and not file_obj.error:
-                    self.file_manager.load_file_content(file_obj)
-                
-                self.add_to_analysis(file_obj)
-                added_count += 1
+        selected_files = self.selected_files
+        pending = [f for f in self.changed_files.values() if f.rel_path not in selected_files]
+        if not pending:
+            self.set_status("All files already selected")
+            return
         
-        if added_count > 0:
-            self.status_var.set(f"Added {added_count} files to analysis")
-            self.root.after(2000, lambda: self.status_var.set("Ready"))
+        # Content that isn't loaded yet is read on a worker so the UI stays responsive
+        to_load = [f for f in pending if not f.content_preview and not f.error]
+        if to_load:
+            self.set_status(f"Loading {len(to_load)} files...")
+            self.io_pool.submit(self.load_for_append_all, pending, to_load)
         else:
-            self.status_var.set("All files already selected")
+            self.finish_append_all(pending)
+    
+    def load_for_append_all(self, pending, to_load):
+        """Load file contents in parallel (background thread) - reads are I/O bound"""
+        list(self.read_pool.map(self.file_manager.load_file_content, to_load))
+        self.root.after(0, self.finish_append_all, pending)
+    
+    def finish_append_all(self, pending):
+        """Add the loaded files to analysis (Tk thread)"""
+        # Files removed or selected individually while loading are skipped
+        selected_files = self.selected_files
+        changed_files = self.changed_files
+        added = [f for f in pending
+                 if f.rel_path not in selected_files and changed_files.get(f.rel_path) is f]
+        
+        # Only mutate selection state per file, then append to the pane once
+        for file_obj in added:
+            self.add_to_analysis(file_obj, defer_display=True)
+        
+        if added:
+            self.append_selected_blocks(added)
+            self.show_toast(f"Added {len(added)} files to analysis")
+        else:
+            self.set_status("All files already selected")
     
     def clear_selection(self):
         """Clear all selected files from analysis"""
         self.selected_files.clear()
+        self.selected_positions.clear()
         
         # Uncheck all checkboxes
-        for file_obj in self.changed_files:
+        for file_obj in self.changed_files.values():
             if hasattr(file_obj, 'widgets') and 'select_var' in file_obj.widgets:
                 file_obj.widgets['select_var'].set(False)
             file_obj.selected_for_analysis = False
         
         self.update_selected_display()
-        self.status_var.set("Selection cleared")
-        self.root.after(2000, lambda: self.status_var.set("Ready"))
+        self.show_toast("Selection cleared")
 
     def update_selected_display(self):
-        """Update the Selected for Analysis pane"""
-        self.selected_text.delete('1.0', tk.END)
+        """Rebuild the Selected for Analysis pane from selected_files"""
+        text = self.selected_text
+        text.delete('1.0', tk.END)
+        block_tags = [tag for tag in text.tag_names() if tag.startswith('file-')]
+        if block_tags:
+            text.tag_delete(*block_tags)
         
         if not self.selected_files:
-            self.selected_text.insert('1.0', "No files selected for analysis")
+            text.insert('1.0', "No files selected for analysis")
             return
         
-        for i, file_obj in enumerate(self.selected_files, 1):
-            header = f"=== File {i}: {file_obj.rel_path} ===\n"
-            self.selected_text.insert(tk.INSERT, header)
-            
+        self.append_selected_blocks(list(self.selected_files.values()), replace=True)
+    
+    @staticmethod
+    def selected_block_tag(file_obj):
+        """Text tag spanning a selected file's block in the Selected pane"""
+        return f"file-{id(file_obj)}"
+    
+    @staticmethod
+    def selected_block_header(number, file_obj):
+        return f"=== File {number}: {file_obj.rel_path} ==="
+    
+    def append_selected_blocks(self, files, replace=False):
+        """Append blocks for files newly added to the end of selected_files
+        
+        Each block carries its own tag so a later removal only touches that
+        block and the headers after it, instead of rewriting the whole pane.
+        """
+        text = self.selected_text
+        first_number = len(self.selected_files) - len(files) + 1
+        if first_number == 1 and not replace:
+            # The pane only holds the empty-state message
+            text.delete('1.0', tk.END)
+        
+        # Insert every block in a single Tk call, each with its tag
+        args = []
+        for number, file_obj in enumerate(files, first_number):
             if file_obj.content_preview:
-                self.selected_text.insert(tk.INSERT, file_obj.content_preview + "\n\n")
+                body = file_obj.content_preview + "\n\n"
             else:
-                self.selected_text.insert(tk.INSERT, 
-                    "[Content not loaded - click 'Show Content' first]\n\n")
+                body = "[Content not loaded - click 'Show Content' first]\n\n"
+            args.append(f"{self.selected_block_header(number, file_obj)}\n{body}")
+            args.append((self.selected_block_tag(file_obj),))
+        
+        text.insert(tk.END, *args)
+        text.yview_moveto(0.0)
+    
+    def remove_selected_block(self, file_obj, position):
+        """Delete a removed file's block and renumber the headers and positions after it"""
+        text = self.selected_text
+        tag = self.selected_block_tag(file_obj)
+        ranges = text.tag_ranges(tag)
+        if ranges:
+            text.delete(ranges[0], ranges[-1])
+        text.tag_delete(tag)
+        
+        if not self.selected_files:
+            text.delete('1.0', tk.END)
+            text.insert('1.0', "No files selected for analysis")
+            return
+        
+        # Only the header lines of later files change; their content stays put
+        positions = self.selected_positions
+        for number, later in enumerate(islice(self.selected_files.values(), position, None), position + 1):
+            positions[later.rel_path] = number - 1
+            later_tag = self.selected_block_tag(later)
+            start = text.index(f"{later_tag}.first")
+            text.delete(start, f"{start} lineend")
+            text.insert(start, self.selected_block_header(number, later), (later_tag,))
     
     # ========== AI INTEGRATION ==========
     
@@ -1204,29 +1588,27 @@ class WorkflowAutomator:
         """Send prompt to Claude Code CLI headlessly and display response"""
         try:
             if not self.project_path:
-                self.status_var.set("⚠️ No project loaded")
+                self.set_status("⚠️ No project loaded")
                 return
             
             # Validate prompt text
             if not prompt_text or not prompt_text.strip():
-                self.status_var.set("⚠️ Empty prompt - please provide instructions")
+                self.set_status("⚠️ Empty prompt - please provide instructions")
                 return
             
             print(f"DEBUG: Sending prompt to headless Claude in directory: {self.project_path}")
             print(f"DEBUG: Prompt length: {len(prompt_text)} characters")
             
             # Update status to show we're processing
-            self.status_var.set("🤖 Sending to Claude Code...")
+            self.set_status("🤖 Sending to Claude Code...")
             
             # Check if Claude is available
             if not self.claude_runner.is_claude_available():
-                self.status_var.set("❌ Claude Code CLI not found")
+                self.set_status("❌ Claude Code CLI not found")
                 return
             
             # Get selected files content for context
-            files_content = self.selected_text.get('1.0', tk.END).strip()
-            if files_content == "No files selected for analysis":
-                files_content = ""
+            files_content = self.get_selected_content()
             
             # Create comprehensive prompt with file context
             if files_content:
@@ -1242,22 +1624,21 @@ class WorkflowAutomator:
                     print(f"DEBUG: Response length: {len(result)} characters")
                     
                     # Display the response in the analysis panel
-                    self.root.after(0, lambda: self.analysis_panel.display_analysis(
-                        result, "Claude Agent", "Headless Claude Code execution"))
+                    self.root.after(0, self.analysis_panel.display_analysis,
+                                    result, "Claude Agent", "Headless Claude Code execution")
                     
                     # Save to chat history
-                    self.root.after(0, lambda: self.save_claude_response_to_history(
-                        prompt_text, result))
+                    self.root.after(0, self.save_claude_response_to_history, prompt_text, result)
                     
-                    self.root.after(0, lambda: self.status_var.set("✅ Claude response received"))
+                    self.root.after_idle(self.set_status, "✅ Claude response received")
                 else:
                     print(f"DEBUG: Claude execution failed: {error}")
-                    self.root.after(0, lambda: self.status_var.set(f"❌ Claude failed: {error}"))
+                    self.root.after(0, self.set_status, f"❌ Claude failed: {error}")
                     
                     # Show error in analysis panel
                     error_message = f"Claude Code execution failed:\n\n{error}\n\nPlease check that:\n1. Claude Code CLI is installed and in PATH\n2. You have proper authentication\n3. The prompt is valid"
-                    self.root.after(0, lambda: self.analysis_panel.display_analysis(
-                        error_message, "Error", "Claude execution error"))
+                    self.root.after(0, self.analysis_panel.display_analysis,
+                                    error_message, "Error", "Claude execution error")
             
             # Define allowed tools for safe file editing
             allowed_tools = [
@@ -1285,7 +1666,7 @@ class WorkflowAutomator:
             
         except Exception as e:
             print(f"DEBUG: Error in send_to_claude_headless: {e}")
-            self.status_var.set("❌ Failed to send to Claude - check console")
+            self.set_status("❌ Failed to send to Claude - check console")
     
     def save_claude_response_to_history(self, prompt_text, response_text):
         """Save Claude response to chat history"""
@@ -1299,9 +1680,7 @@ class WorkflowAutomator:
                     token_usage={"total_tokens": len(response_text.split())}  # Rough token estimate
                 )
                 
-                # Update history display if visible
-                if not self.history_section_collapsed:
-                    self.refresh_chat_history_display()
+                self.schedule_history_refresh()
                     
         except Exception as e:
             print(f"DEBUG: Error saving Claude response to history: {e}")
@@ -1319,78 +1698,145 @@ class WorkflowAutomator:
             return
         
         # Get content and prompt
-        content = self.selected_text.get('1.0', tk.END).strip()
-        if not content or content == "No files selected for analysis":
+        content = self.get_selected_content()
+        if not content:
             messagebox.showwarning("Warning", "No content to analyze")
             return
         
         # Get prompt based on type
+        panel = self.analysis_panel
         if prompt_type == 'orchestrator':
-            custom_prompt = self.analysis_panel.orchestrator_text.get('1.0', tk.END).strip()
-            automated = self.analysis_panel.orchestrator_automated_var.get()
+            prompt_widget, automated_var = panel.orchestrator_text, panel.orchestrator_automated_var
         else:
-            custom_prompt = self.analysis_panel.prompt_text.get('1.0', tk.END).strip()
-            automated = self.analysis_panel.prompt_automated_var.get()
-        
-        # Run in background thread
-        threading.Thread(target=self.perform_ai_analysis, 
-                        args=(content, custom_prompt, prompt_type, automated), 
-                        daemon=True).start()
+            prompt_widget, automated_var = panel.prompt_text, panel.prompt_automated_var
+        custom_prompt = panel.get_prompt_text(prompt_widget)
+        automated = automated_var.get()
+        
+        # Run on a pooled background thread; status is set here on the Tk thread
+        self.set_status("Analyzing...")
+        self.ai_pool.submit(self.perform_ai_analysis,
+                            content, custom_prompt, prompt_type, automated)
     
     def perform_ai_analysis(self, content, prompt, prompt_type, automated):
         """Perform AI analysis in background"""
+        after = self.root.after
+        api = self.api_client
+        model_used = api.selected_model
+        # The response is rendered as it streams in instead of after the full reply
+        stream = self.analysis_panel.open_stream(prompt_type, prompt, model_used)
         try:
-            self.root.after(0, lambda: self.status_var.set("Analyzing..."))
-            
-            # Call appropriate API
-            if self.api_client.preferred_api == 'anthropic':
-                result, error = self.api_client.perform_anthropic_analysis(content, prompt)
+            # Identical content and prompt reuse the earlier result without a request
+            result = api.get_cached_analysis(content, prompt)
+            if result is not None:
+                token_usage = {'prompt_tokens': 0, 'completion_tokens': 0, 'total_tokens': 0}
             else:
-                result, error = self.api_client.perform_openai_analysis(content, prompt)
-            
-            if error:
-                self.root.after(0, lambda: messagebox.showwarning("API Error", error))
-                self.root.after(0, lambda: self.status_var.set("Ready"))
-                return
+                # Call the preferred API
+                result, error = api.perform_analysis(content, prompt, stream.write)
+                
+                if error:
+                    after(0, self.fail_analysis, messagebox.showwarning, "API Error", error, stream)
+                    return
+                
+                api.cache_analysis(content, prompt, result)
+                prompt_tokens = api.last_prompt_tokens
+                completion_tokens = api.last_completion_tokens
+                token_usage = {
+                    'prompt_tokens': prompt_tokens,
+                    'completion_tokens': completion_tokens,
+                    'total_tokens': prompt_tokens + completion_tokens
+                }
             
             # Save to chat history
-            token_info = self.api_client.get_token_usage_info()
             chat_entry = self.chat_history_manager.add_chat_entry(
                 prompt_type=prompt_type,
                 prompt_text=prompt,
                 response_text=result,
-                model_used=self.api_client.selected_model,
-                token_usage={
-                    'prompt_tokens': self.api_client.last_prompt_tokens,
-                    'completion_tokens': self.api_client.last_completion_tokens,
-                    'total_tokens': self.api_client.last_prompt_tokens + self.api_client.last_completion_tokens
-                }
+                model_used=model_used,
+                token_usage=token_usage
             )
             
-            # Display result in main thread with model information
-            self.root.after(0, lambda: self.analysis_panel.display_analysis(
-                result, prompt_type, prompt, self.api_client.selected_model))
-            self.root.after(0, lambda: self.status_var.set("Analysis complete"))
-            
-            # If automated checkbox is checked, send result to Claude CLI automatically
-            if automated:
-                print(f"DEBUG: Automation enabled - will send result to headless Claude")
-                self.root.after(1000, lambda: self.send_to_claude_headless(result))  # Small delay to let UI update
-            else:
-                print(f"DEBUG: Automation disabled - result will not be auto-sent")
-            
-            # Update token display and refresh history if visible
-            self.root.after(0, self.update_token_display)
-            if not self.history_section_collapsed:
-                self.root.after(0, self.refresh_chat_history_display)
+            # Display result in main thread with model information - one post per completion
+            after(0, self.finish_analysis,
+                  result, prompt_type, prompt, model_used, automated, stream)
             
+        except OSError as e:
+            # API errors come back as (None, error); only I/O such as saving history lands here
+            after(0, self.fail_analysis, messagebox.showerror, "Error", f"Analysis failed: {e}", stream)
         except Exception as e:
-            self.root.after(0, lambda: messagebox.showerror("Error", f"Analysis failed: {e}"))
-            self.root.after(0, lambda: self.status_var.set("Ready"))
+            # Bugs are logged with a traceback rather than shown in a generic dialog
+            logger.exception("Analysis failed unexpectedly")
+            after(0, self.fail_analysis, None, "Error", f"Analysis failed unexpectedly: {e}", stream)
+    
+    def finish_analysis(self, result, prompt_type, prompt, model_used, automated, stream=None):
+        """Show a completed analysis and update dependent UI (Tk thread)"""
+        if stream is not None:
+            stream.close(result)
+        if stream is None or not stream.started:
+            self.analysis_panel.display_analysis(result, prompt_type, prompt, model_used)
+        self.set_status("Analysis complete")
+        
+        # If automated checkbox is checked, send result to Claude CLI automatically
+        if automated:
+            print(f"DEBUG: Automation enabled - will send result to headless Claude")
+            self.root.after(1000, self.send_to_claude_headless, result)  # Small delay to let UI update
+        else:
+            print(f"DEBUG: Automation disabled - result will not be auto-sent")
+        
+        # Token display and history aren't urgent - let Tk fold them into an idle pass
+        self.schedule_token_display()
+        self.schedule_history_refresh()
+    
+    def fail_analysis(self, show_dialog, title, message, stream=None):
+        """Reset status and report a failed analysis (Tk thread)
+        
+        With show_dialog None the failure is only shown in the status bar.
+        """
+        if stream is not None:
+            stream.close()  # Keep any partial text, without Send to Agent
+        if show_dialog is None:
+            self.set_status(f"❌ {message} - details in {LOG_FILE}")
+            return
+        self.set_status("Ready")
+        self.queue_error(show_dialog, title, message)
+    
+    def queue_error(self, show_dialog, title, message, delay=200):
+        """Queue an error dialog; errors arriving within delay ms share one dialog"""
+        self.error_queue.append((show_dialog, title, message))
+        if not self.error_report_id:
+            self.error_report_id = self.root.after(delay, self.report_errors)
+    
+    def report_errors(self):
+        """Show all queued errors in a single modal dialog"""
+        self.error_report_id = None
+        errors = list(self.error_queue)
+        self.error_queue.clear()
+        
+        if len(errors) == 1:
+            show_dialog, title, message = errors[0]
+            show_dialog(title, message)
+        elif errors:
+            details = "\n\n".join(f"{title}: {message}" for _, title, message in errors)
+            messagebox.showerror("Errors", f"{len(errors)} analyses failed:\n\n{details}")
+
+
+def setup_logging():
+    """Send the app's warnings and errors to LOG_FILE, or the console if it can't be opened
+    
+    Only the app logger is configured, so HTTP client chatter stays out of the file.
+    """
+    try:
+        os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
+        handler = RotatingFileHandler(LOG_FILE, maxBytes=1024 * 1024, backupCount=2, encoding='utf-8')
+    except OSError:
+        handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(logging.WARNING)
 
 
 def main():
     """Main entry point"""
+    setup_logging()
     root = tk.Tk()
     app = WorkflowAutomator(root)
     root.mainloop()
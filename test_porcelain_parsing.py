@@ -5,10 +5,17 @@ Comprehensive test for git status --porcelain parsing.
 Tests the robust regex approach and edge cases.
 """
 
+import os
 import re
 import sys
 from pathlib import Path
 
+# Import git_manager on its own: importing the components package would pull
+# in the API client and its third-party dependencies
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'components'))
+
+from git_manager import GitManager
+
 def parse_porcelain_line(line):
     """Parse git status --porcelain line robustly with regex"""
     if not line or len(line) < 3:
@@ -169,6 +176,37 @@ def test_regex_edge_cases():
     
     return all_passed
 
+def test_nul_delimited_parsing():
+    """Test -z output: unquoted paths and rename records"""
+    print("NUL-Delimited Parsing Test")
+    print("=" * 30)
+    
+    # The original path of a rename/copy is its own record and must be skipped,
+    # even when it looks like a status record itself
+    output = (b"M  src/app.py\0"
+              b" M src/file with spaces.py\0"
+              b"R  src/new_name.py\0old/name.py\0"
+              b"C  src/copy.py\0original.py\0"
+              b"RM src/moved.py\0M  looks_like_a_record.py\0"
+              b"?? caf\xc3\xa9.txt\0")
+    expected = [
+        ("M", "src/app.py"),
+        ("M", "src/file with spaces.py"),
+        ("R", "src/new_name.py"),
+        ("C", "src/copy.py"),
+        ("RM", "src/moved.py"),
+        ("??", "café.txt"),
+    ]
+    
+    entries = GitManager().parse_porcelain_output(output)
+    print(f"Expected: {expected}")
+    print(f"Got:      {entries}")
+    
+    passed = entries == expected
+    print("[PASS]" if passed else "[FAIL]")
+    assert passed
+    return passed
+
 if __name__ == "__main__":
     print("Running Porcelain Parser Test Suite")
     print("=" * 50)
@@ -177,6 +215,7 @@ if __name__ == "__main__":
     results.append(test_porcelain_parsing())
     results.append(test_path_reconstruction())
     results.append(test_regex_edge_cases())
+    results.append(test_nul_delimited_parsing())
     
     print("\n" + "=" * 50)
     print("FINAL RESULTS:")